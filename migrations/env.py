@@ -14,7 +14,6 @@ load_dotenv()
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
-config.set_main_option("sqlalchemy.url", os.getenv("POSTGRES_CONNECTION_STRING"))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -23,7 +22,11 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-from models.base import Base
+from models.base import Base, engine_url
+
+config.set_main_option(
+    "sqlalchemy.url", engine_url(os.getenv("POSTGRES_CONNECTION_STRING"))
+)
 
 # Debug: Verify tables are loaded
 # print(f"✅ Loaded {len(Base.metadata.tables)} tables:")
@@ -33,6 +36,13 @@ from models.base import Base
 target_metadata = Base.metadata
 
 
+def include_name(name, type_, parent_names):
+    """Leave the loaders' UNLOGGED `<table>_stage` twins out of autogenerate."""
+    if type_ == "table":
+        return not name.endswith("_stage")
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,10 +61,11 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    db_url = os.environ.get("POSTGRES_CONNECTION_STRING")
+    db_url = engine_url(os.environ.get("POSTGRES_CONNECTION_STRING"))
     context.configure(
         url=db_url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -77,7 +88,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,72 @@
+"""enum columns to smallint codes
+
+Revision ID: 3f1a9c2d7e41
+Revises: 6c87c90c274e
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7e41'
+down_revision: Union[str, Sequence[str], None] = '6c87c90c274e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, postgres enum type, labels in code order starting at 1)
+ENUM_COLUMNS = [
+    ('operator_share_events', 'event_type', 'shareeventtype',
+     ['INCREASED', 'DECREASED']),
+    ('staker_delegation_events', 'delegation_type', 'delegationtype',
+     ['DELEGATED', 'UNDELEGATED', 'FORCE_UNDELEGATED']),
+    ('withdrawal_events', 'event_type', 'withdrawaleventtype',
+     ['QUEUED', 'COMPLETED']),
+    ('operator_avs_registration_status_updated_events', 'status', 'avsregistrationstatus',
+     ['REGISTERED', 'UNREGISTERED']),
+    ('strategy_operator_set_events', 'event_type', 'strategyoperatorseteventtype',
+     ['ADDED', 'REMOVED']),
+    ('rewards_submission_events', 'submission_type', 'rewardssubmissiontype',
+     ['AVS_REWARDS', 'REWARDS_FOR_ALL', 'REWARDS_FOR_ALL_EARNERS',
+      'OPERATOR_DIRECTED_AVS', 'OPERATOR_DIRECTED_OPERATOR_SET']),
+    ('strategy_whitelist_events', 'event_type', 'strategywhitelisteventtype',
+     ['ADDED', 'REMOVED']),
+    ('pod_shares_update_events', 'update_type', 'podsharesupdatetype',
+     ['SHARES_UPDATED', 'NEW_TOTAL_SHARES']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, enum_name, labels in ENUM_COLUMNS:
+        cases = ' '.join(
+            f"WHEN '{label}' THEN {code}" for code, label in enumerate(labels, 1)
+        )
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT '
+            f'USING CASE {column}::text {cases} END'
+        )
+        op.create_check_constraint(
+            f'ck_{table}_{column}',
+            table,
+            f"{column} IN ({', '.join(str(c) for c in range(1, len(labels) + 1))})",
+        )
+        op.execute(f'DROP TYPE {enum_name}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, enum_name, labels in ENUM_COLUMNS:
+        sa.Enum(*labels, name=enum_name).create(op.get_bind())
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        cases = ' '.join(
+            f"WHEN {code} THEN '{label}'" for code, label in enumerate(labels, 1)
+        )
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} '
+            f'USING (CASE {column} {cases} END)::{enum_name}'
+        )
@@ -0,0 +1,111 @@
+"""move raw_data to event_raw
+
+Revision ID: 5a7c2e91d3f6
+Revises: 1d9e6b3f4c80
+Create Date: 2026-10-16 11:20:48.609731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c2e91d3f6'
+down_revision: Union[str, Sequence[str], None] = '1d9e6b3f4c80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EVENT_TABLES = [
+    'activation_delay_set_events',
+    'allocation_delay_set_events',
+    'allocation_events',
+    'avs_metadata_update_events',
+    'avs_registrar_set_events',
+    'beacon_chain_deposit_events',
+    'beacon_chain_eth_withdrawal_completed_events',
+    'beacon_chain_slashing_events',
+    'beacon_chain_withdrawal_events',
+    'burn_or_redistributable_shares_decreased_events',
+    'burn_or_redistributable_shares_increased_events',
+    'burnable_eth_shares_increased_events',
+    'burnable_shares_decreased_events',
+    'claimer_for_set_events',
+    'default_operator_split_bips_set_events',
+    'delegation_approver_updated_events',
+    'deposit_events',
+    'deposit_scaling_factor_updated_events',
+    'distribution_root_disabled_events',
+    'distribution_root_submitted_events',
+    'encumbered_magnitude_updated_events',
+    'max_magnitude_updated_events',
+    'operator_added_to_operator_set_events',
+    'operator_avs_registration_status_updated_events',
+    'operator_avs_split_bips_set_events',
+    'operator_directed_avs_rewards_submission_events',
+    'operator_directed_operator_set_rewards_submission_events',
+    'operator_metadata_update_events',
+    'operator_pi_split_bips_set_events',
+    'operator_registered_events',
+    'operator_removed_from_operator_set_events',
+    'operator_set_created_events',
+    'operator_set_split_bips_set_events',
+    'operator_share_events',
+    'operator_shares_slashed_events',
+    'operator_slashed_events',
+    'pectra_fork_timestamp_set_events',
+    'pod_deployed_events',
+    'pod_shares_update_events',
+    'proof_timestamp_setter_set_events',
+    'redistribution_address_set_events',
+    'rewards_claimed_events',
+    'rewards_for_all_submitter_set_events',
+    'rewards_submission_events',
+    'rewards_updater_set_events',
+    'staker_delegation_events',
+    'staker_force_undelegated_events',
+    'strategy_operator_set_events',
+    'strategy_whitelist_events',
+    'strategy_whitelister_changed_events',
+    'withdrawal_events',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_raw',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('raw_data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.PrimaryKeyConstraint('table_name', 'event_id')
+    )
+    op.execute('ALTER TABLE event_raw ALTER COLUMN raw_data SET STORAGE EXTERNAL')
+
+    for table in EVENT_TABLES:
+        op.execute(
+            f"INSERT INTO event_raw (table_name, event_id, raw_data) "
+            f"SELECT '{table}', id, raw_data FROM {table} "
+            f"ON CONFLICT (table_name, event_id) DO NOTHING"
+        )
+        op.drop_column(table, 'raw_data')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in EVENT_TABLES:
+        op.add_column(
+            table,
+            sa.Column('raw_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        )
+        op.execute(
+            f"UPDATE {table} SET raw_data = event_raw.raw_data "
+            f"FROM event_raw WHERE event_raw.table_name = '{table}' "
+            f"AND event_raw.event_id = {table}.id"
+        )
+        op.execute(f"UPDATE {table} SET raw_data = '{{}}'::jsonb WHERE raw_data IS NULL")
+        op.alter_column(table, 'raw_data', nullable=False)
+
+    op.drop_table('event_raw')
@@ -0,0 +1,70 @@
+"""narrow integer columns
+
+Revision ID: 7b3e5d19c2a4
+Revises: e08b4d6c1a52
+Create Date: 2026-10-16 12:40:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e5d19c2a4'
+down_revision: Union[str, Sequence[str], None] = 'e08b4d6c1a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, new type); all columns were BIGINT NOT NULL
+NARROWED_COLUMNS = [
+    # basis points, 0..10000
+    ('default_operator_split_bips_set_events', 'old_default_operator_split_bips', sa.SmallInteger()),
+    ('default_operator_split_bips_set_events', 'new_default_operator_split_bips', sa.SmallInteger()),
+    ('operator_avs_split_bips_set_events', 'old_operator_avs_split_bips', sa.SmallInteger()),
+    ('operator_avs_split_bips_set_events', 'new_operator_avs_split_bips', sa.SmallInteger()),
+    ('operator_pi_split_bips_set_events', 'old_operator_pi_split_bips', sa.SmallInteger()),
+    ('operator_pi_split_bips_set_events', 'new_operator_pi_split_bips', sa.SmallInteger()),
+    ('operator_set_split_bips_set_events', 'old_operator_set_split_bips', sa.SmallInteger()),
+    ('operator_set_split_bips_set_events', 'new_operator_set_split_bips', sa.SmallInteger()),
+    # counters, ids and block numbers, all < 2^31
+    ('withdrawal_events', 'nonce', sa.Integer()),
+    ('beacon_chain_withdrawal_events', 'nonce', sa.Integer()),
+    ('beacon_chain_eth_withdrawal_completed_events', 'nonce', sa.Integer()),
+    ('rewards_submission_events', 'submission_nonce', sa.Integer()),
+    ('operator_directed_avs_rewards_submission_events', 'submission_nonce', sa.Integer()),
+    ('operator_directed_operator_set_rewards_submission_events', 'submission_nonce', sa.Integer()),
+    ('distribution_root_submitted_events', 'root_index', sa.Integer()),
+    ('distribution_root_disabled_events', 'root_index', sa.Integer()),
+    ('burn_or_redistributable_shares_increased_events', 'slash_id', sa.Integer()),
+    ('burn_or_redistributable_shares_decreased_events', 'slash_id', sa.Integer()),
+    ('allocation_delay_set_events', 'delay', sa.Integer()),
+    ('allocation_delay_set_events', 'effect_block', sa.Integer()),
+    ('allocation_events', 'effect_block', sa.Integer()),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, type_ in NARROWED_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.BigInteger(),
+            type_=type_,
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, type_ in reversed(NARROWED_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=type_,
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+        )
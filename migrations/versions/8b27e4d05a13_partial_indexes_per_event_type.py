@@ -0,0 +1,51 @@
+"""partial indexes per event type
+
+Revision ID: 8b27e4d05a13
+Revises: 3f1a9c2d7e41
+Create Date: 2026-10-16 09:40:02.551870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b27e4d05a13'
+down_revision: Union[str, Sequence[str], None] = '3f1a9c2d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, enum column, indexed columns, {index suffix: code})
+PARTIAL_INDEXES = [
+    ('operator_share_events', 'event_type', ['operator_id', 'block_number'],
+     {'increased': 1, 'decreased': 2}),
+    ('staker_delegation_events', 'delegation_type', ['operator_id', 'block_number'],
+     {'delegated': 1, 'undelegated': 2, 'force_undelegated': 3}),
+    ('withdrawal_events', 'event_type', ['staker_id', 'block_number'],
+     {'queued': 1, 'completed': 2}),
+    ('strategy_operator_set_events', 'event_type', ['operator_set_id', 'block_number'],
+     {'added': 1, 'removed': 2}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, columns, codes in PARTIAL_INDEXES:
+        for suffix, code in codes.items():
+            op.create_index(
+                f'ix_{table}_{suffix}',
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(f'{column} = {code}'),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _column, _columns, codes in PARTIAL_INDEXES:
+        for suffix in codes:
+            op.drop_index(f'ix_{table}_{suffix}', table_name=table)
@@ -0,0 +1,158 @@
+"""event check constraints and planner statistics
+
+Revision ID: 92c6f0a4e7d3
+Revises: 7b3e5d19c2a4
+Create Date: 2026-10-16 13:05:47.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '92c6f0a4e7d3'
+down_revision: Union[str, Sequence[str], None] = '7b3e5d19c2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EVENT_TABLES = [
+    'activation_delay_set_events',
+    'allocation_delay_set_events',
+    'allocation_events',
+    'avs_metadata_update_events',
+    'avs_registrar_set_events',
+    'beacon_chain_deposit_events',
+    'beacon_chain_eth_withdrawal_completed_events',
+    'beacon_chain_slashing_events',
+    'beacon_chain_withdrawal_events',
+    'burn_or_redistributable_shares_decreased_events',
+    'burn_or_redistributable_shares_increased_events',
+    'burnable_eth_shares_increased_events',
+    'burnable_shares_decreased_events',
+    'claimer_for_set_events',
+    'default_operator_split_bips_set_events',
+    'delegation_approver_updated_events',
+    'deposit_events',
+    'deposit_scaling_factor_updated_events',
+    'distribution_root_disabled_events',
+    'distribution_root_submitted_events',
+    'encumbered_magnitude_updated_events',
+    'max_magnitude_updated_events',
+    'operator_added_to_operator_set_events',
+    'operator_avs_registration_status_updated_events',
+    'operator_avs_split_bips_set_events',
+    'operator_directed_avs_rewards_submission_events',
+    'operator_directed_operator_set_rewards_submission_events',
+    'operator_metadata_update_events',
+    'operator_pi_split_bips_set_events',
+    'operator_registered_events',
+    'operator_removed_from_operator_set_events',
+    'operator_set_created_events',
+    'operator_set_split_bips_set_events',
+    'operator_share_events',
+    'operator_shares_slashed_events',
+    'operator_slashed_events',
+    'pectra_fork_timestamp_set_events',
+    'pod_deployed_events',
+    'pod_shares_update_events',
+    'proof_timestamp_setter_set_events',
+    'redistribution_address_set_events',
+    'rewards_claimed_events',
+    'rewards_for_all_submitter_set_events',
+    'rewards_submission_events',
+    'rewards_updater_set_events',
+    'staker_delegation_events',
+    'staker_force_undelegated_events',
+    'strategy_operator_set_events',
+    'strategy_whitelist_events',
+    'strategy_whitelister_changed_events',
+    'withdrawal_events',
+]
+
+# (table, entity FK columns) that get a raised statistics target
+STATISTICS_COLUMNS = [
+    ('allocation_delay_set_events', ['operator_id']),
+    ('allocation_events', ['operator_id', 'strategy_id']),
+    ('beacon_chain_slashing_events', ['staker_id']),
+    ('burn_or_redistributable_shares_decreased_events', ['strategy_id']),
+    ('burn_or_redistributable_shares_increased_events', ['strategy_id']),
+    ('burnable_shares_decreased_events', ['strategy_id']),
+    ('delegation_approver_updated_events', ['operator_id']),
+    ('deposit_events', ['staker_id', 'strategy_id']),
+    ('deposit_scaling_factor_updated_events', ['staker_id', 'strategy_id']),
+    ('encumbered_magnitude_updated_events', ['operator_id', 'strategy_id']),
+    ('max_magnitude_updated_events', ['operator_id', 'strategy_id']),
+    ('operator_added_to_operator_set_events', ['operator_id']),
+    ('operator_avs_registration_status_updated_events', ['operator_id']),
+    ('operator_avs_split_bips_set_events', ['operator_id']),
+    ('operator_metadata_update_events', ['operator_id']),
+    ('operator_pi_split_bips_set_events', ['operator_id']),
+    ('operator_registered_events', ['operator_id']),
+    ('operator_removed_from_operator_set_events', ['operator_id']),
+    ('operator_set_split_bips_set_events', ['operator_id']),
+    ('operator_share_events', ['operator_id', 'staker_id', 'strategy_id']),
+    ('operator_shares_slashed_events', ['operator_id', 'strategy_id']),
+    ('operator_slashed_events', ['operator_id']),
+    ('staker_delegation_events', ['operator_id', 'staker_id']),
+    ('staker_force_undelegated_events', ['operator_id', 'staker_id']),
+    ('strategy_operator_set_events', ['strategy_id']),
+    ('strategy_whitelist_events', ['strategy_id']),
+    ('withdrawal_events', ['staker_id']),
+]
+STATISTICS_TARGET = 1000
+
+HOT_TABLES = [
+    'operator_share_events',
+    'staker_delegation_events',
+    'deposit_events',
+    'withdrawal_events',
+    'operator_shares_slashed_events',
+    'allocation_events',
+    'encumbered_magnitude_updated_events',
+    'max_magnitude_updated_events',
+    'deposit_scaling_factor_updated_events',
+    'pod_shares_update_events',
+]
+
+
+def _constraint_name(table: str, suffix: str) -> str:
+    """Mirror of models.base.index_name(..., prefix='ck')."""
+    name = f'ck_{table}_{suffix}'
+    if len(name) > 63:
+        name = f'ck_{table[:63 - len(suffix) - 4]}_{suffix}'
+    return name
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in EVENT_TABLES:
+        op.create_check_constraint(
+            _constraint_name(table, 'position'),
+            table,
+            'log_index >= 0 AND block_number > 0',
+        )
+
+    for table, columns in STATISTICS_COLUMNS:
+        for column in columns:
+            op.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} SET STATISTICS {STATISTICS_TARGET}'
+            )
+
+    for table in HOT_TABLES:
+        op.execute(f'ALTER TABLE {table} SET (autovacuum_analyze_scale_factor = 0.02)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in HOT_TABLES:
+        op.execute(f'ALTER TABLE {table} RESET (autovacuum_analyze_scale_factor)')
+
+    for table, columns in STATISTICS_COLUMNS:
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET STATISTICS -1')
+
+    for table in EVENT_TABLES:
+        op.drop_constraint(_constraint_name(table, 'position'), table, type_='check')
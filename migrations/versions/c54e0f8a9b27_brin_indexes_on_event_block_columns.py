@@ -0,0 +1,104 @@
+"""brin indexes on event block columns
+
+Revision ID: c54e0f8a9b27
+Revises: 8b27e4d05a13
+Create Date: 2026-10-16 10:05:31.804113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c54e0f8a9b27'
+down_revision: Union[str, Sequence[str], None] = '8b27e4d05a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EVENT_TABLES = [
+    'activation_delay_set_events',
+    'allocation_delay_set_events',
+    'allocation_events',
+    'avs_metadata_update_events',
+    'avs_registrar_set_events',
+    'beacon_chain_deposit_events',
+    'beacon_chain_eth_withdrawal_completed_events',
+    'beacon_chain_slashing_events',
+    'beacon_chain_withdrawal_events',
+    'burn_or_redistributable_shares_decreased_events',
+    'burn_or_redistributable_shares_increased_events',
+    'burnable_eth_shares_increased_events',
+    'burnable_shares_decreased_events',
+    'claimer_for_set_events',
+    'default_operator_split_bips_set_events',
+    'delegation_approver_updated_events',
+    'deposit_events',
+    'deposit_scaling_factor_updated_events',
+    'distribution_root_disabled_events',
+    'distribution_root_submitted_events',
+    'encumbered_magnitude_updated_events',
+    'max_magnitude_updated_events',
+    'operator_added_to_operator_set_events',
+    'operator_avs_registration_status_updated_events',
+    'operator_avs_split_bips_set_events',
+    'operator_directed_avs_rewards_submission_events',
+    'operator_directed_operator_set_rewards_submission_events',
+    'operator_metadata_update_events',
+    'operator_pi_split_bips_set_events',
+    'operator_registered_events',
+    'operator_removed_from_operator_set_events',
+    'operator_set_created_events',
+    'operator_set_split_bips_set_events',
+    'operator_share_events',
+    'operator_shares_slashed_events',
+    'operator_slashed_events',
+    'pectra_fork_timestamp_set_events',
+    'pod_deployed_events',
+    'pod_shares_update_events',
+    'proof_timestamp_setter_set_events',
+    'redistribution_address_set_events',
+    'rewards_claimed_events',
+    'rewards_for_all_submitter_set_events',
+    'rewards_submission_events',
+    'rewards_updater_set_events',
+    'staker_delegation_events',
+    'staker_force_undelegated_events',
+    'strategy_operator_set_events',
+    'strategy_whitelist_events',
+    'strategy_whitelister_changed_events',
+    'withdrawal_events',
+]
+
+BRIN_COLUMNS = ['block_number', 'block_timestamp']
+
+
+def _index_name(table: str, suffix: str) -> str:
+    """Mirror of models.base.index_name (trims to Postgres' 63 chars)."""
+    name = f'ix_{table}_{suffix}'
+    if len(name) > 63:
+        name = f'ix_{table[:63 - len(suffix) - 4]}_{suffix}'
+    return name
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in EVENT_TABLES:
+        for column in BRIN_COLUMNS:
+            op.create_index(
+                _index_name(table, f'{column}_brin'),
+                table,
+                [column],
+                unique=False,
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in EVENT_TABLES:
+        for column in BRIN_COLUMNS:
+            op.drop_index(_index_name(table, f'{column}_brin'), table_name=table)
@@ -0,0 +1,50 @@
+"""covering indexes for share aggregations
+
+Revision ID: e08b4d6c1a52
+Revises: 5a7c2e91d3f6
+Create Date: 2026-10-16 11:58:09.240517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e08b4d6c1a52'
+down_revision: Union[str, Sequence[str], None] = '5a7c2e91d3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, entity column, INCLUDE columns)
+COVERING_INDEXES = [
+    ('operator_share_events', 'operator_id', ['shares', 'event_type']),
+    ('deposit_events', 'staker_id', ['shares']),
+    ('operator_shares_slashed_events', 'operator_id', ['total_slashed_shares']),
+    ('allocation_events', 'operator_id', ['magnitude']),
+    ('pod_shares_update_events', 'pod_owner_id', ['shares_delta', 'new_total_shares']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, entity, include in COVERING_INDEXES:
+        op.create_index(
+            f'ix_{table}_{entity}_agg',
+            table,
+            [entity, 'block_number'],
+            unique=False,
+            postgresql_include=include,
+        )
+        op.execute(
+            f'ALTER TABLE {table} SET (autovacuum_vacuum_insert_scale_factor = 0.02)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, entity, _include in COVERING_INDEXES:
+        op.execute(f'ALTER TABLE {table} RESET (autovacuum_vacuum_insert_scale_factor)')
+        op.drop_index(f'ix_{table}_{entity}_agg', table_name=table)
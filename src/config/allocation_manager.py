@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 ALLOCATION_DELAY_SET_CONFIG: EventConfig = {
     "graphql_name": "allocationDelaySets",
@@ -21,13 +22,7 @@ ALLOCATION_DELAY_SET_CONFIG: EventConfig = {
     ],
     "nested_fields": {"operator": ["id", "address"]},
     "entity_dependencies": ["Operator"],
-    "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Operator": lambda df: entity_ids(df["operator"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -66,11 +61,7 @@ ALLOCATION_EVENT_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "OperatorSet", "Strategy"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
         "OperatorSet": lambda df: df["operatorSet"]
         .apply(
             lambda x: (
@@ -91,11 +82,7 @@ ALLOCATION_EVENT_CONFIG: EventConfig = {
         )
         .dropna()
         .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -133,16 +120,8 @@ ENCUMBERED_MAGNITUDE_UPDATED_CONFIG: EventConfig = {
     "nested_fields": {"operator": ["id", "address"], "strategy": ["id", "address"]},
     "entity_dependencies": ["Operator", "Strategy"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -177,16 +156,8 @@ MAX_MAGNITUDE_UPDATED_CONFIG: EventConfig = {
     "nested_fields": {"operator": ["id", "address"], "strategy": ["id", "address"]},
     "entity_dependencies": ["Operator", "Strategy"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -226,11 +197,7 @@ OPERATOR_SLASHED_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "OperatorSet"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
         "OperatorSet": lambda df: df["operatorSet"]
         .apply(
             lambda x: (
@@ -285,13 +252,7 @@ AVS_REGISTRAR_SET_CONFIG: EventConfig = {
     ],
     "nested_fields": {"avs": ["id", "address"]},
     "entity_dependencies": ["AVS"],
-    "entity_extractors": {
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"AVS": lambda df: entity_ids(df["avs"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -321,13 +282,7 @@ AVS_METADATA_UPDATE_CONFIG: EventConfig = {
     ],
     "nested_fields": {"avs": ["id", "address"]},
     "entity_dependencies": ["AVS"],
-    "entity_extractors": {
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"AVS": lambda df: entity_ids(df["avs"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -379,11 +334,7 @@ OPERATOR_SET_CREATED_CONFIG: EventConfig = {
         )
         .dropna()
         .tolist(),
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "AVS": lambda df: entity_ids(df["avs"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -419,11 +370,7 @@ OPERATOR_ADDED_TO_OPERATOR_SET_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "OperatorSet"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
         "OperatorSet": lambda df: df["operatorSet"]
         .apply(
             lambda x: (
@@ -479,11 +426,7 @@ OPERATOR_REMOVED_FROM_OPERATOR_SET_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "OperatorSet"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
         "OperatorSet": lambda df: df["operatorSet"]
         .apply(
             lambda x: (
@@ -611,11 +554,7 @@ STRATEGY_OPERATOR_SET_EVENT_CONFIG: EventConfig = {
         )
         .dropna()
         .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
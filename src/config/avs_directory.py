@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 
 OPERATOR_AVS_REGISTRATION_STATUS_UPDATED_CONFIG: EventConfig = {
@@ -23,16 +24,8 @@ OPERATOR_AVS_REGISTRATION_STATUS_UPDATED_CONFIG: EventConfig = {
     "nested_fields": {"operator": ["id", "address"], "avs": ["id", "address"]},
     "entity_dependencies": ["Operator", "AVS"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "AVS": lambda df: entity_ids(df["avs"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
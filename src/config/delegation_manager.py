@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 OPERATOR_REGISTERED_CONFIG: EventConfig = {
     "graphql_name": "operatorRegistereds",
@@ -20,13 +21,7 @@ OPERATOR_REGISTERED_CONFIG: EventConfig = {
     ],
     "nested_fields": {"operator": ["id", "address"]},
     "entity_dependencies": ["Operator"],
-    "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Operator": lambda df: entity_ids(df["operator"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -56,13 +51,7 @@ DELEGATION_APPROVER_UPDATED_CONFIG: EventConfig = {
     ],
     "nested_fields": {"operator": ["id", "address"]},
     "entity_dependencies": ["Operator"],
-    "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Operator": lambda df: entity_ids(df["operator"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -92,13 +81,7 @@ OPERATOR_METADATA_UPDATE_CONFIG: EventConfig = {
     ],
     "nested_fields": {"operator": ["id", "address"]},
     "entity_dependencies": ["Operator"],
-    "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Operator": lambda df: entity_ids(df["operator"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -136,21 +119,9 @@ OPERATOR_SHARE_EVENT_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "Staker", "Strategy"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -188,16 +159,8 @@ STAKER_DELEGATION_EVENT_CONFIG: EventConfig = {
     "nested_fields": {"staker": ["id", "address"], "operator": ["id", "address"]},
     "entity_dependencies": ["Staker", "Operator"],
     "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Operator": lambda df: entity_ids(df["operator"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -231,16 +194,8 @@ STAKER_FORCE_UNDELEGATED_CONFIG: EventConfig = {
     "nested_fields": {"staker": ["id", "address"], "operator": ["id", "address"]},
     "entity_dependencies": ["Staker", "Operator"],
     "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Operator": lambda df: entity_ids(df["operator"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -274,16 +229,8 @@ DEPOSIT_SCALING_FACTOR_UPDATED_CONFIG: EventConfig = {
     "nested_fields": {"staker": ["id", "address"], "strategy": ["id", "address"]},
     "entity_dependencies": ["Staker", "Strategy"],
     "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -324,16 +271,8 @@ WITHDRAWAL_EVENT_CONFIG: EventConfig = {
     "nested_fields": {"staker": ["id", "address"], "delegatedTo": ["id", "address"]},
     "entity_dependencies": ["Staker", "Operator"],
     "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Operator": lambda df: df["delegatedTo"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Operator": lambda df: entity_ids(df["delegatedTo"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -374,16 +313,8 @@ OPERATOR_SHARES_SLASHED_CONFIG: EventConfig = {
     "nested_fields": {"operator": ["id", "address"], "strategy": ["id", "address"]},
     "entity_dependencies": ["Operator", "Strategy"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
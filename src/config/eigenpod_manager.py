@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 
 POD_DEPLOYED_CONFIG: EventConfig = {
@@ -39,11 +40,7 @@ POD_DEPLOYED_CONFIG: EventConfig = {
             for _, row in df.iterrows()
             if row.get("pod") is not None
         ],
-        "Staker": lambda df: df["owner"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["owner"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -94,11 +91,7 @@ BEACON_CHAIN_DEPOSIT_CONFIG: EventConfig = {
             for _, row in df.iterrows()
             if row.get("pod") is not None
         ],
-        "Staker": lambda df: df["podOwner"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["podOwner"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -152,11 +145,7 @@ POD_SHARES_UPDATE_CONFIG: EventConfig = {
             for _, row in df.iterrows()
             if row.get("pod") is not None
         ],
-        "Staker": lambda df: df["podOwner"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["podOwner"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -214,11 +203,7 @@ BEACON_CHAIN_WITHDRAWAL_CONFIG: EventConfig = {
             for _, row in df.iterrows()
             if row.get("pod") is not None
         ],
-        "Staker": lambda df: df["podOwner"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["podOwner"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -259,13 +244,7 @@ BEACON_CHAIN_ETH_WITHDRAWAL_COMPLETED_CONFIG: EventConfig = {
     ],
     "nested_fields": {"podOwner": ["id", "address"]},
     "entity_dependencies": ["Staker"],
-    "entity_extractors": {
-        "Staker": lambda df: df["podOwner"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Staker": lambda df: entity_ids(df["podOwner"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -300,13 +279,7 @@ BEACON_CHAIN_SLASHING_EVENT_CONFIG: EventConfig = {
     ],
     "nested_fields": {"staker": ["id", "address"]},
     "entity_dependencies": ["Staker"],
-    "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Staker": lambda df: entity_ids(df["staker"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
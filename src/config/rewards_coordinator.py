@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 
 REWARDS_SUBMISSION_CONFIG: EventConfig = {
@@ -29,13 +30,7 @@ REWARDS_SUBMISSION_CONFIG: EventConfig = {
     ],
     "nested_fields": {"avs": ["id", "address"]},
     "entity_dependencies": ["AVS"],
-    "entity_extractors": {
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"AVS": lambda df: entity_ids(df["avs"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -81,13 +76,7 @@ OPERATOR_DIRECTED_AVS_REWARDS_SUBMISSION_CONFIG: EventConfig = {
     ],
     "nested_fields": {"avs": ["id", "address"]},
     "entity_dependencies": ["AVS"],
-    "entity_extractors": {
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"AVS": lambda df: entity_ids(df["avs"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -315,16 +304,8 @@ OPERATOR_AVS_SPLIT_BIPS_SET_CONFIG: EventConfig = {
     "nested_fields": {"operator": ["id", "address"], "avs": ["id", "address"]},
     "entity_dependencies": ["Operator", "AVS"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "AVS": lambda df: df["avs"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
+        "AVS": lambda df: entity_ids(df["avs"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -363,13 +344,7 @@ OPERATOR_PI_SPLIT_BIPS_SET_CONFIG: EventConfig = {
     ],
     "nested_fields": {"operator": ["id", "address"]},
     "entity_dependencies": ["Operator"],
-    "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Operator": lambda df: entity_ids(df["operator"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -410,11 +385,7 @@ OPERATOR_SET_SPLIT_BIPS_SET_CONFIG: EventConfig = {
     },
     "entity_dependencies": ["Operator", "OperatorSet"],
     "entity_extractors": {
-        "Operator": lambda df: df["operator"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Operator": lambda df: entity_ids(df["operator"]),
         "OperatorSet": lambda df: df["operatorSet"]
         .apply(
             lambda x: (
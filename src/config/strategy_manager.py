@@ -4,6 +4,7 @@
 
 from typing import Dict
 from config.config_schema import EventConfig
+from utils.event_transformers import entity_ids
 
 
 DEPOSIT_CONFIG: EventConfig = {
@@ -23,16 +24,8 @@ DEPOSIT_CONFIG: EventConfig = {
     "nested_fields": {"staker": ["id", "address"], "strategy": ["id", "address"]},
     "entity_dependencies": ["Staker", "Strategy"],
     "entity_extractors": {
-        "Staker": lambda df: df["staker"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Staker": lambda df: entity_ids(df["staker"]),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -94,13 +87,7 @@ STRATEGY_WHITELIST_EVENT_CONFIG: EventConfig = {
     ],
     "nested_fields": {"strategy": ["id", "address"]},
     "entity_dependencies": ["Strategy"],
-    "entity_extractors": {
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Strategy": lambda df: entity_ids(df["strategy"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -156,11 +143,7 @@ BURN_OR_REDISTRIBUTABLE_SHARES_INCREASED_CONFIG: EventConfig = {
         )
         .dropna()
         .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -220,11 +203,7 @@ BURN_OR_REDISTRIBUTABLE_SHARES_DECREASED_CONFIG: EventConfig = {
         )
         .dropna()
         .tolist(),
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist(),
+        "Strategy": lambda df: entity_ids(df["strategy"]),
     },
     "column_mapping": {
         "logIndex": "log_index",
@@ -258,13 +237,7 @@ BURNABLE_SHARES_DECREASED_CONFIG: EventConfig = {
     ],
     "nested_fields": {"strategy": ["id", "address"]},
     "entity_dependencies": ["Strategy"],
-    "entity_extractors": {
-        "Strategy": lambda df: df["strategy"]
-        .apply(lambda x: x["id"] if isinstance(x, dict) else x)
-        .dropna()
-        .unique()
-        .tolist()
-    },
+    "entity_extractors": {"Strategy": lambda df: entity_ids(df["strategy"])},
     "column_mapping": {
         "logIndex": "log_index",
         "transactionHash": "transaction_hash",
@@ -4,39 +4,87 @@ Handles connection pooling and session management.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Iterator, List
+import logging
 
 import dagster as dg
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, Row, text
 from sqlalchemy.orm import sessionmaker, Session
 
+from models.base import ENGINE_KW, engine_url
+
+# Engine logging_name: statements of this client's engine are logged under
+# "sqlalchemy.engine.Engine.subgraph_pipeline", apart from other engines in
+# the process (e.g. Dagster's own event log storage)
+ENGINE_LOGGING_NAME = "subgraph_pipeline"
+
+
+class _DagsterLogHandler(logging.Handler):
+    """Forwards Python log records to a Dagster logger (the run's event log)."""
+
+    def __init__(self, dagster_log) -> None:
+        super().__init__()
+        self._dagster_log = dagster_log
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._dagster_log.log(record.levelno, self.format(record))
+
 
 class DatabaseClient(dg.ConfigurableResource):
     """
     SQLAlchemy database client for Postgres.
 
     Config:
-        connection_string: PostgreSQL connection string
-        pool_size: Connection pool size (default: 5)
-        max_overflow: Max overflow connections (default: 10)
+        connection_string: PostgreSQL connection string (driver is forced to psycopg v3)
+        pool_size: Connection pool size (default: ENGINE_KW, 25)
+        max_overflow: Max overflow connections (default: ENGINE_KW, 25)
+        pool_timeout: Seconds to wait for a free connection (default: ENGINE_KW, 30)
+        pool_recycle: Replace connections older than this many seconds
+            (default: ENGINE_KW, 1800)
+        pool_pre_ping: Test each connection on checkout (default: ENGINE_KW, True);
+            turn off when stale connections aren't a problem, it costs a
+            round-trip per checkout
+        echo: Log every SQL statement and its parameters to the run's
+            Dagster log, not stdout (default: False)
     """
 
     connection_string: str
-    pool_size: int = 5
-    max_overflow: int = 10
+    pool_size: int = ENGINE_KW["pool_size"]
+    max_overflow: int = ENGINE_KW["max_overflow"]
+    pool_timeout: int = ENGINE_KW["pool_timeout"]
+    pool_recycle: int = ENGINE_KW["pool_recycle"]
+    pool_pre_ping: bool = ENGINE_KW["pool_pre_ping"]
+    echo: bool = False
 
     def setup_for_execution(self, context: dg.InitResourceContext) -> None:
         """Initialize engine and session factory."""
         self._engine = create_engine(
-            self.connection_string,
-            pool_pre_ping=True,  # Verify connections before using
-            pool_size=self.pool_size,
-            max_overflow=self.max_overflow,
-            echo=True,  # Set to True for SQL debugging
+            engine_url(self.connection_string),
+            **{
+                **ENGINE_KW,
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "pool_timeout": self.pool_timeout,
+                "pool_recycle": self.pool_recycle,
+                "pool_pre_ping": self.pool_pre_ping,
+            },
+            logging_name=ENGINE_LOGGING_NAME,
+        )
+        # Writes go through Core statements: no ORM state to reload after
+        # commit, nothing to flush before reads
+        self._session_factory = sessionmaker(
+            bind=self._engine, expire_on_commit=False, autoflush=False
         )
-        self._session_factory = sessionmaker(bind=self._engine)
 
         context.log.info(f"Database client initialized with pool_size={self.pool_size}")
+        if self.echo:
+            # Same records as echo=True, minus its stdout handler (one
+            # write lock shared by every process of the run)
+            sql_logger = self._engine.logger
+            sql_logger.addHandler(_DagsterLogHandler(context.log))
+            sql_logger.setLevel(logging.INFO)
+            sql_logger.propagate = False
+            context.log.debug("SQL statement logging (echo) is enabled")
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -63,17 +111,35 @@ class DatabaseClient(dg.ConfigurableResource):
         """Direct access to SQLAlchemy engine for utilities."""
         return self._engine
 
-    def execute_query(self, query: str, params: dict = None):
+    def execute_query(
+        self, query: str, params: dict = None, batch_size: int = 1000
+    ) -> Iterator[Row]:
+        """
+        Execute a raw SQL query and stream its rows.
+
+        Rows come from a server-side cursor, `batch_size` at a time, so large
+        scans are never held in memory at once. Runs outside a session (no
+        commit); the connection is held until the generator is exhausted or
+        closed.
+        """
+        with self._engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(text(query), params or {})
+            yield from result
+
+    def fetch_all(self, query: str, params: dict = None) -> List[Row]:
         """
-        Execute a raw SQL query and return results.
-        Useful for debugging or one-off queries.
+        Execute a raw SQL query and return all rows.
+        Useful for debugging or one-off queries with small results.
         """
-        with self.get_session() as session:
-            result = session.execute(query, params or {})
-            return result.fetchall()
+        return list(self.execute_query(query, params))
 
     def teardown_after_execution(self, context: dg.InitResourceContext) -> None:
         """Clean up connections."""
         if hasattr(self, "_engine"):
+            for handler in list(self._engine.logger.handlers):
+                if isinstance(handler, _DagsterLogHandler):
+                    self._engine.logger.removeHandler(handler)
             self._engine.dispose()
             context.log.info("Database connections disposed")
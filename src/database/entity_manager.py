@@ -1,15 +1,71 @@
-from typing import List, Dict, Any
-from datetime import datetime, timezone
+from collections import OrderedDict, defaultdict
+import threading
+from typing import Any, Dict, Iterable, List
+from sqlalchemy import event, func, literal_column
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 import dagster as dg
 
 from models.entities import Operator, Staker, AVS, Strategy, OperatorSet, EigenPod
 
+# Rows per INSERT statement; keeps bind parameters well under Postgres' 65535
+UPSERT_BATCH_SIZE = 5000
+
+
+# Ids remembered per entity table (LRU-evicted beyond this)
+KNOWN_IDS_MAXSIZE = 200_000
+
+
+def _batches(rows: List[Dict[str, Any]]):
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        yield rows[start : start + UPSERT_BATCH_SIZE]
+
+
+class _KnownIds:
+    """Bounded LRU set of entity ids known to be committed."""
+
+    def __init__(self, maxsize: int = KNOWN_IDS_MAXSIZE):
+        self.maxsize = maxsize
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+        # Event loads of a group run in threads
+        self._lock = threading.Lock()
+
+    def unknown(self, ids: Iterable[str]) -> List[str]:
+        """Return the ids not seen yet, refreshing the ones that were."""
+        missing = []
+        with self._lock:
+            for entity_id in ids:
+                if entity_id in self._ids:
+                    self._ids.move_to_end(entity_id)
+                else:
+                    missing.append(entity_id)
+        return missing
+
+    def add(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            for entity_id in ids:
+                self._ids[entity_id] = None
+                self._ids.move_to_end(entity_id)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+
+
+# Process-wide, so it outlives the per-run resource instances
+_KNOWN_IDS: Dict[str, _KnownIds] = defaultdict(_KnownIds)
+
+
+def _remember_on_commit(session: Session, known: _KnownIds, ids: List[str]) -> None:
+    """Mark `ids` as known once (and only if) the session commits."""
+    if ids:
+        event.listen(session, "after_commit", lambda _: known.add(ids), once=True)
+
 
 class EntityManager(dg.ConfigurableResource):
     """
     Unified entity manager with generic upsert for simple address-based entities.
+    Each call issues one multi-row INSERT ... ON CONFLICT per batch of ids;
+    ids committed earlier in the process are skipped without a round-trip
+    (EigenPods excepted, their owner can change).
     """
 
     # =================================================================== #
@@ -27,62 +83,43 @@ class EntityManager(dg.ConfigurableResource):
         - PK = `id` (string)
         - `address` = `id`
         - No foreign keys
+
+        Existing rows are left untouched (ON CONFLICT DO NOTHING). Ids already
+        committed by this process are not sent again.
         """
         if not entity_ids:
             return {"inserted": 0, "updated": 0, "skipped": 0}
 
-        unique_ids = list(set(entity_ids))
-        inserted = updated = skipped = 0
-        now = datetime.now(timezone.utc)
-
-        for entity_id in unique_ids:
-            try:
-                stmt = (
-                    insert(model)
-                    .values(
-                        id=entity_id,
-                        address=entity_id,
-                        created_at=now,
-                        updated_at=now,
-                    )
-                    .on_conflict_do_update(
-                        index_elements=["id"],
-                        set_={"updated_at": now},
-                    )
-                    .returning(
-                        model.id,
-                        model.created_at,
-                        model.updated_at,
-                    )
-                )
+        unique_ids = set(entity_ids)
+        known = _KNOWN_IDS[model.__tablename__]
 
-                result = session.execute(stmt)
-                row = result.fetchone()
+        # Sorted so concurrent runs lock rows in the same order
+        rows = [
+            {"id": entity_id, "address": entity_id}
+            for entity_id in sorted(known.unknown(unique_ids))
+        ]
+        inserted = 0
 
-                if row:
-                    # Access by index instead of attribute names
-                    if row[1] == row[2]:  # created_at == updated_at
-                        inserted += 1
-                    else:
-                        updated += 1
-                else:
-                    skipped += 1
+        for batch in _batches(rows):
+            stmt = (
+                insert(model)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(model.id)
+            )
+            # Conflicting ids are not returned
+            inserted += len(session.execute(stmt).all())
 
-            except Exception as e:
-                if context:
-                    context.log.warning(
-                        f"Failed to upsert {model.__tablename__} {entity_id}: {e}"
-                    )
-                skipped += 1
-                continue
+        _remember_on_commit(session, known, [row["id"] for row in rows])
+        skipped = len(unique_ids) - inserted
 
         if context:
             context.log.info(
                 f"{model.__name__} upsert: {inserted} inserted, "
-                f"{updated} updated, {skipped} skipped out of {len(unique_ids)}"
+                f"0 updated, {skipped} skipped out of {len(unique_ids)}"
             )
 
-        return {"inserted": inserted, "updated": updated, "skipped": skipped}
+        return {"inserted": inserted, "updated": 0, "skipped": skipped}
 
     # =================================================================== #
     # Public wrappers — clean API, no duplication
@@ -113,8 +150,7 @@ class EntityManager(dg.ConfigurableResource):
         if not operator_set_data:
             return {"inserted": 0, "updated": 0, "skipped": 0}
 
-        inserted = updated = skipped = 0
-        now = datetime.now(timezone.utc)
+        rows_by_id = {}
 
         for entry in operator_set_data:
             avs_id = entry.get("avs_id")
@@ -124,55 +160,37 @@ class EntityManager(dg.ConfigurableResource):
             if not avs_id or op_set_id is None:
                 if context:
                     context.log.warning(f"Invalid operator set data: {entry}")
-                skipped += 1
                 continue
 
-            try:
-                stmt = (
-                    insert(OperatorSet)
-                    .values(
-                        id=composite_id,
-                        avs_id=avs_id,
-                        operator_set_id=op_set_id,
-                        created_at=now,
-                        updated_at=now,
-                    )
-                    .on_conflict_do_update(
-                        index_elements=["id"],
-                        set_={"updated_at": now},
-                    )
-                    .returning(
-                        OperatorSet.id,
-                        OperatorSet.created_at,
-                        OperatorSet.updated_at,
-                    )
-                )
-                result = session.execute(stmt)
-                row = result.fetchone()
-
-                if row:
-                    # Access by index
-                    if row[1] == row[2]:  # created_at == updated_at
-                        inserted += 1
-                    else:
-                        updated += 1
-                else:
-                    skipped += 1
+            rows_by_id[composite_id] = {
+                "id": composite_id,
+                "avs_id": avs_id,
+                "operator_set_id": op_set_id,
+            }
 
-            except Exception as e:
-                if context:
-                    context.log.warning(
-                        f"Failed to upsert operator set {composite_id}: {e}"
-                    )
-                skipped += 1
-                continue
+        known = _KNOWN_IDS[OperatorSet.__tablename__]
+        rows = [rows_by_id[key] for key in sorted(known.unknown(rows_by_id))]
+        inserted = 0
+
+        for batch in _batches(rows):
+            stmt = (
+                insert(OperatorSet)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(OperatorSet.id)
+            )
+            # Conflicting ids are not returned
+            inserted += len(session.execute(stmt).all())
+
+        _remember_on_commit(session, known, [row["id"] for row in rows])
+        skipped = len(operator_set_data) - inserted
 
         if context:
             context.log.info(
-                f"OperatorSet upsert: {inserted} inserted, {updated} updated, "
+                f"OperatorSet upsert: {inserted} inserted, 0 updated, "
                 f"{skipped} skipped out of {len(operator_set_data)}"
             )
-        return {"inserted": inserted, "updated": updated, "skipped": skipped}
+        return {"inserted": inserted, "updated": 0, "skipped": skipped}
 
     # =================================================================== #
     # SPECIAL: EigenPod (FK to Staker)
@@ -186,8 +204,8 @@ class EntityManager(dg.ConfigurableResource):
         if not pod_data:
             return {"inserted": 0, "updated": 0, "skipped": 0}
 
-        inserted = updated = skipped = 0
-        now = datetime.now(timezone.utc)
+        # Later entries win: one statement can't touch the same row twice
+        rows_by_id = {}
 
         for entry in pod_data:
             pod_address = entry.get("address")
@@ -199,50 +217,37 @@ class EntityManager(dg.ConfigurableResource):
                     context.log.warning(
                         f"Invalid EigenPod data (missing address/owner): {entry}"
                     )
-                skipped += 1
                 continue
 
-            try:
-                stmt = (
-                    insert(EigenPod)
-                    .values(
-                        id=pod_id,
-                        address=pod_address,
-                        owner_id=owner_id,
-                        created_at=now,
-                        updated_at=now,
-                    )
-                    .on_conflict_do_update(
-                        index_elements=["id"],
-                        set_={
-                            "owner_id": owner_id,
-                            "updated_at": now,
-                        },
-                        where=(EigenPod.owner_id != owner_id),
-                    )
-                    .returning(
-                        EigenPod.id,
-                        EigenPod.created_at,
-                        EigenPod.updated_at,
-                    )
-                )
-                result = session.execute(stmt)
-                row = result.fetchone()
-
-                if row:
-                    # Access by index
-                    if row[1] == row[2]:  # created_at == updated_at
-                        inserted += 1
-                    else:
-                        updated += 1
+            rows_by_id[pod_id] = {
+                "id": pod_id,
+                "address": pod_address,
+                "owner_id": owner_id,
+            }
+
+        rows = [rows_by_id[key] for key in sorted(rows_by_id)]
+        inserted = updated = 0
+
+        for batch in _batches(rows):
+            stmt = insert(EigenPod).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "owner_id": stmt.excluded.owner_id,
+                    "updated_at": func.now(),
+                },
+                where=(EigenPod.owner_id != stmt.excluded.owner_id),
+            ).returning(
+                # xmax is 0 only for freshly inserted tuples
+                literal_column("xmax = 0")
+            )
+            for (was_inserted,) in session.execute(stmt):
+                if was_inserted:
+                    inserted += 1
                 else:
-                    skipped += 1
+                    updated += 1
 
-            except Exception as e:
-                if context:
-                    context.log.warning(f"Failed to upsert EigenPod {pod_id}: {e}")
-                skipped += 1
-                continue
+        skipped = len(pod_data) - inserted - updated
 
         if context:
             context.log.info(
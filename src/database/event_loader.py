@@ -3,20 +3,100 @@ Event loader for inserting event records into PostgreSQL.
 Handles deduplication, type conversions, and conflict logging.
 """
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
+import time
 
 import dagster as dg
+import orjson
 import pandas as pd
-from sqlalchemy import Table, MetaData, case, desc, literal_column
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import (
+    Column,
+    Table,
+    MetaData,
+    desc,
+    literal,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy import insert as sa_insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
+from models import Base, EventRaw
+from models.events import get_event_model
+
+# Rows per VALUES page on the non-COPY insert path
+INSERT_PAGE_SIZE = 1000
+
+# Per-connection stage for raw payloads (JSON text, cast to JSONB on promote)
+RAW_STAGE_TABLE = "event_raw_stage"
+RAW_STAGE_DDL = (
+    f"CREATE TEMP TABLE IF NOT EXISTS {RAW_STAGE_TABLE} "
+    "(table_name varchar, event_id varchar, raw_data text)"
+)
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _is_missing(value: Any) -> bool:
+    """NaN/None check that is safe for list and dict values."""
+    return not isinstance(value, (list, dict)) and pd.isna(value)
+
+
+def _has_native_dtype(series: pd.Series, col: Column) -> bool:
+    """
+    True when the column's dtype already unboxes to the Python type COPY
+    expects for `col` (int64 for integer columns, bool, string), so the
+    per-value conversion can be skipped.
+    """
+    col_type = str(col.type).upper()
+    if "ARRAY" in col_type or "JSON" in col_type:
+        return False
+    if "INT" in col_type:
+        return pd.api.types.is_integer_dtype(series.dtype)
+    if "BOOLEAN" in col_type:
+        return pd.api.types.is_bool_dtype(series.dtype)
+    if "VARCHAR" in col_type:
+        return isinstance(series.dtype, pd.StringDtype)
+    return False
+
+
+def _to_json(value: Any) -> Any:
+    # Ensure it's valid JSON
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _to_json_text(value: Any) -> str:
+    """Raw payload as JSON text (it may already be serialized)."""
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _to_list(value: Any, item_is_int: bool) -> list:
+    # Ensure it's a list
+    if isinstance(value, list):
+        items = value
+    elif isinstance(value, str):
+        items = json.loads(value)
+    else:
+        items = [value]
+    if item_is_int:
+        items = [None if item is None else int(item) for item in items]
+    return items
+
 
 class EventLoader(dg.ConfigurableResource):
     """
     Loads event data into PostgreSQL event tables.
-    Handles ON CONFLICT with detailed logging.
+    Events are append-only: rows whose id already exists are skipped.
     """
 
     def load_events(
@@ -29,6 +109,10 @@ class EventLoader(dg.ConfigurableResource):
         """
         Load events from DataFrame into specified table.
 
+        Rows are streamed with COPY into the table's UNLOGGED staging twin,
+        then promoted in one INSERT ... SELECT ... ON CONFLICT (id) DO NOTHING.
+        Other databases get a paged multi-row INSERT instead.
+
         Args:
             session: SQLAlchemy session
             df: DataFrame with event data (already transformed)
@@ -41,66 +125,49 @@ class EventLoader(dg.ConfigurableResource):
         if df.empty:
             return {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
 
-        inserted = 0
-        updated = 0
-        skipped = 0
         errors = 0
+        failed = []
+
+        model = get_event_model(table_name)
+        table = model.__table__
+        enum_columns = self._get_enum_columns(table_name)
+
+        try:
+            rows = self._prepare_rows(df, table, enum_columns)
+        except Exception:
+            # Some value doesn't convert: redo it row by row so only the bad
+            # rows are counted and dropped
+            rows = []
+            for idx, row in df.iterrows():
+                try:
+                    row_data = self._prepare_row_data(row, table, enum_columns)
+                    if row_data.get("created_at") is None:
+                        row_data["created_at"] = int(time.time())
+                    rows.append(tuple(row_data.get(col.name) for col in table.columns))
+
+                except Exception as e:
+                    errors += 1
+                    failed.append(idx)
+                    if context:
+                        context.log.warning(
+                            f"Failed to load event row {idx} (id: {row.get('id', 'unknown')}): {e}"
+                        )
+                    continue
+
+        # Events are immutable: an existing id is already loaded
+        if not rows:
+            inserted = 0
+        elif session.get_bind().dialect.name == "postgresql":
+            inserted = self._copy_rows(session, model, rows)
+        else:
+            inserted = self._insert_rows(session, model, rows)
+        skipped = len(rows) - inserted
+        updated = 0
 
-        # Get table metadata
-        metadata = MetaData()
-        metadata.reflect(bind=session.bind, only=[table_name])
-        table = metadata.tables[table_name]
-
-        # Process each row
-        for idx, row in df.iterrows():
-            try:
-                row_data = self._prepare_row_data(row, table)
-
-                stmt = insert(table).values(**row_data)
-                update_dict = {
-                    col.name: stmt.excluded[col.name]
-                    for col in table.columns
-                    if col.name not in ["id", "created_at"]  # Don't update created_at
-                }
-                update_dict["updated_at"] = stmt.excluded.updated_at
-
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_=update_dict,
-                    where=(
-                        table.c.updated_at != stmt.excluded.updated_at
-                    ),  # skip identical updates
-                ).returning(
-                    table.c.id,
-                    # Compare created_at with updated_at from the RESULT table
-                    # If they're equal, it was just inserted
-                    case(
-                        (
-                            table.c.created_at == table.c.updated_at,
-                            literal_column("'inserted'"),
-                        ),
-                        else_=literal_column("'updated'"),
-                    ).label("action"),
-                )
-
-                result = session.execute(stmt)
-                row_result = result.fetchone()
-
-                if row_result is not None:
-                    if row_result.action == "inserted":
-                        inserted += 1
-                    else:
-                        updated += 1
-                else:
-                    skipped += 1
-
-            except Exception as e:
-                errors += 1
-                if context:
-                    context.log.warning(
-                        f"Failed to load event row {idx} (id: {row.get('id', 'unknown')}): {e}"
-                    )
-                continue
+        # Raw payloads go to the event_raw sidecar, not the event table;
+        # rows that failed conversion never reach it, so get no payload
+        if "raw_data" in df.columns:
+            self._load_raw_data(session, df.drop(index=failed), table_name)
 
         if context:
             context.log.info(
@@ -116,14 +183,190 @@ class EventLoader(dg.ConfigurableResource):
             "errors": errors,
         }
 
-    def _prepare_row_data(self, row: pd.Series, table: Table) -> Dict[str, Any]:
+    def _copy_rows(self, session: Session, model: type, rows: List[tuple]) -> int:
+        """
+        COPY `rows` (one value per table column, in column order) into the
+        model's staging table and promote them. Returns the number inserted.
+        """
+        table = model.__table__
+        columns = ", ".join(col.name for col in table.columns)
+        types = [
+            col.type.compile(dialect=postgresql.dialect()).lower()
+            for col in table.columns
+        ]
+
+        session.execute(text(model.staging_ddl()))
+        # TRUNCATE locks the stage table, so concurrent loads of the same
+        # table queue here instead of promoting each other's rows
+        session.execute(text(model.truncate_staging_sql()))
+
+        cursor = session.connection().connection.cursor()
+        try:
+            with cursor.copy(
+                f"COPY {model.staging_table_name()} ({columns}) "
+                "FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(types)
+                for row in rows:
+                    copy.write_row(row)
+        finally:
+            cursor.close()
+
+        result = session.execute(text(model.promote_staging_sql()))
+        session.execute(text(model.truncate_staging_sql()))
+        return result.rowcount
+
+    def _insert_rows(self, session: Session, model: type, rows: List[tuple]) -> int:
+        """
+        Fallback for databases without COPY: one executemany INSERT, sent as
+        multi-row VALUES pages of INSERT_PAGE_SIZE. Returns the number inserted.
+        """
+        table = model.__table__
+        dialect_name = session.get_bind().dialect.name
+        names = [col.name for col in table.columns]
+        key = list(table.primary_key.columns)
+
+        stmt = _DIALECT_INSERTS.get(dialect_name, sa_insert)(table)
+        if hasattr(stmt, "on_conflict_do_nothing"):
+            stmt = stmt.on_conflict_do_nothing(index_elements=key)
+        stmt = stmt.returning(*key).execution_options(
+            insertmanyvalues_page_size=INSERT_PAGE_SIZE
+        )
+
+        result = session.execute(stmt, [dict(zip(names, row)) for row in rows])
+        return len(result.all())
+
+    def _load_raw_data(
+        self, session: Session, df: pd.DataFrame, table_name: str
+    ) -> None:
+        """
+        Store each event's raw payload in event_raw, keyed by (event table,
+        event id). On Postgres the JSON text is COPYed and cast to JSONB by
+        the server, not re-parsed here.
+        """
+        rows = [
+            (table_name, event_id, _to_json_text(raw))
+            for event_id, raw in zip(df["id"], df["raw_data"])
+            if raw is not None
+        ]
+        if not rows:
+            return
+
+        if session.get_bind().dialect.name == "postgresql":
+            self._copy_raw_rows(session, rows)
+        else:
+            self._insert_rows(
+                session,
+                EventRaw,
+                [(table, event_id, orjson.loads(raw)) for table, event_id, raw in rows],
+            )
+
+    def _copy_raw_rows(self, session: Session, rows: List[tuple]) -> None:
+        """
+        COPY (table_name, event_id, JSON text) rows into this connection's
+        temporary raw stage and promote them into event_raw.
+
+        Every event table of a group loads payloads at the same time, so the
+        stage is per connection (TEMP) instead of one UNLOGGED table whose
+        TRUNCATE lock would serialize all of them.
+        """
+        session.execute(text(RAW_STAGE_DDL))
+
+        cursor = session.connection().connection.cursor()
+        try:
+            with cursor.copy(
+                f"COPY {RAW_STAGE_TABLE} (table_name, event_id, raw_data) "
+                "FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["varchar", "varchar", "text"])
+                for row in rows:
+                    copy.write_row(row)
+        finally:
+            cursor.close()
+
+        session.execute(
+            text(
+                "INSERT INTO event_raw (table_name, event_id, raw_data) "
+                f"SELECT table_name, event_id, raw_data::jsonb FROM {RAW_STAGE_TABLE} "
+                "ON CONFLICT (table_name, event_id) DO NOTHING"
+            )
+        )
+        session.execute(text(f"TRUNCATE {RAW_STAGE_TABLE}"))
+
+    def _get_enum_columns(self, table_name: str) -> Dict[str, Any]:
+        """
+        Map column name -> CodedEnum for SMALLINT enum columns of a table.
+
+        Reflected tables carry no Python enum info, so this is read from the
+        model metadata (`Column(..., info={"enum": ...})`).
+        """
+        model_table = Base.metadata.tables.get(table_name)
+        if model_table is None:
+            return {}
+
+        return {
+            col.name: col.info["enum"]
+            for col in model_table.columns
+            if "enum" in col.info
+        }
+
+    def _prepare_rows(
+        self,
+        df: pd.DataFrame,
+        table: Table,
+        enum_columns: Dict[str, Any] = None,
+    ) -> List[tuple]:
+        """
+        Column-wise equivalent of `_prepare_row_data` for a whole DataFrame.
+
+        Each column is converted in one pass and the results are zipped into
+        tuples in table column order, avoiding a Series per row (iterrows).
+        Raises on the first value that doesn't convert.
+        """
+        enum_columns = enum_columns or {}
+        columns = []
+
+        for col in table.columns:
+            if col.name not in df.columns:
+                fill = int(time.time()) if col.name == "created_at" else None
+                columns.append([fill] * len(df))
+                continue
+
+            series = df[col.name]
+            enum = enum_columns.get(col.name)
+            if enum is None and _has_native_dtype(series, col):
+                # Already typed column-wise: unbox the buffer in one go
+                columns.append(
+                    series.astype(object).where(series.notna(), None).tolist()
+                )
+                continue
+
+            convert = self._value_converter(col, enum)
+            columns.append(
+                [
+                    None if _is_missing(value) else convert(value)
+                    for value in series.tolist()
+                ]
+            )
+
+        return list(zip(*columns))
+
+    def _prepare_row_data(
+        self,
+        row: pd.Series,
+        table: Table,
+        enum_columns: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
         """
         Prepare row data for insertion, handling type conversions.
 
         Converts:
         - Dicts/lists to JSON for JSONB columns
-        - Ensures proper types for numeric columns
+        - Enum labels (e.g. "INCREASED") to their SMALLINT codes
+        - Ensures proper types for numeric, boolean and string columns
+          (COPY in binary format needs exact Python types)
         """
+        enum_columns = enum_columns or {}
         row_data = {}
 
         for col in table.columns:
@@ -136,40 +379,47 @@ class EventLoader(dg.ConfigurableResource):
             value = row[col_name]
 
             # Handle NaN/None
-            if pd.isna(value):
+            if _is_missing(value):
                 row_data[col_name] = None
                 continue
 
-            # Type conversions based on column type
-            col_type = str(col.type).upper()
-
-            if "JSONB" in col_type or "JSON" in col_type:
-                # Ensure it's valid JSON
-                if isinstance(value, (dict, list)):
-                    row_data[col_name] = value
-                elif isinstance(value, str):
-                    row_data[col_name] = json.loads(value)
-                else:
-                    row_data[col_name] = value
-
-            elif "BIGINT" in col_type or "INTEGER" in col_type:
-                # Ensure numeric
-                row_data[col_name] = int(value)
-
-            elif "ARRAY" in col_type:
-                # Ensure it's a list
-                if isinstance(value, list):
-                    row_data[col_name] = value
-                elif isinstance(value, str):
-                    row_data[col_name] = json.loads(value)
-                else:
-                    row_data[col_name] = [value]
-            else:
-                # Default: use as-is
-                row_data[col_name] = value
+            convert = self._value_converter(col, enum_columns.get(col_name))
+            row_data[col_name] = convert(value)
 
         return row_data
 
+    def _value_converter(self, col: Column, enum: Any = None) -> Callable[[Any], Any]:
+        """
+        Return the function converting one non-null value of `col` to the
+        Python type expected by the database.
+        """
+        if enum is not None:
+            return lambda value: int(enum.coerce(value))
+
+        # Type conversions based on column type
+        col_type = str(col.type).upper()
+
+        if "JSONB" in col_type or "JSON" in col_type:
+            return _to_json
+
+        if "ARRAY" in col_type:
+            # Subgraph BigInts arrive as strings
+            item_is_int = "INT" in str(col.type.item_type).upper()
+            return lambda value: _to_list(value, item_is_int)
+
+        if "INT" in col_type:
+            # Ensure numeric (BIGINT / INTEGER / SMALLINT)
+            return int
+
+        if "BOOLEAN" in col_type:
+            return bool
+
+        if "VARCHAR" in col_type:
+            return str
+
+        # Default: use as-is
+        return lambda value: value
+
     def get_last_processed_id(
         self, session: Session, table_name: str, id_column: str = "id"
     ) -> str:
@@ -212,10 +462,9 @@ class EventLoader(dg.ConfigurableResource):
         Returns:
             Last block number, or None if table is empty
         """
-        metadata = MetaData()
-        metadata.reflect(bind=session.bind, only=[table_name])
-        table = metadata.tables[table_name]
+        table = get_event_model(table_name).__table__
 
+        # Backward scan of the (block_number, log_index) index
         query = (
             session.query(table.c.block_number)
             .order_by(table.c.block_number.desc())
@@ -225,6 +474,44 @@ class EventLoader(dg.ConfigurableResource):
         result = query.first()
         return result[0] if result else None
 
+    def get_last_cursors(
+        self, session: Session, table_names: List[str]
+    ) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """
+        Get the last processed (block_number, log_index) of several tables in
+        one round-trip (UNION ALL of per-table ORDER BY ... LIMIT 1 probes).
+
+        Args:
+            session: SQLAlchemy session
+            table_names: Event table names
+
+        Returns:
+            {table_name: (block_number, log_index)}, (None, None) for empty tables
+        """
+        cursors = {table_name: (None, None) for table_name in table_names}
+        if not table_names:
+            return cursors
+
+        probes = []
+        for table_name in table_names:
+            table = get_event_model(table_name).__table__
+            probes.append(
+                select(
+                    literal(table_name).label("table_name"),
+                    table.c.block_number,
+                    table.c.log_index,
+                )
+                .order_by(desc(table.c.block_number), desc(table.c.log_index))
+                .limit(1)
+                .subquery()
+                .select()
+            )
+
+        for row in session.execute(union_all(*probes)):
+            cursors[row.table_name] = (row.block_number, row.log_index)
+
+        return cursors
+
     def get_last_cursor(self, session: Session, table_name: str):
         """
         Get the last processed (block_number, log_index) for incremental loading.
@@ -236,10 +523,9 @@ class EventLoader(dg.ConfigurableResource):
         Returns:
             Tuple (block_number, log_index) or (None, None) if table is empty
         """
-        metadata = MetaData()
-        metadata.reflect(bind=session.bind, only=[table_name])
-        table = metadata.tables[table_name]
+        table = get_event_model(table_name).__table__
 
+        # Backward scan of the (block_number, log_index) index
         query = (
             session.query(table.c.block_number, table.c.log_index)
             .order_by(desc(table.c.block_number), desc(table.c.log_index))
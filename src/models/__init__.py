@@ -1,9 +1,10 @@
 # models/__init__.py
-from .base import Base, TimestampMixin
+from .base import Base, ImmutableEventMixin, TimestampMixin
 
 # Import ALL models to register them with Base.metadata
 from .entities import Operator, Staker, AVS, Strategy, OperatorSet, EigenPod
 from .events import (
+    EventRaw,
     OperatorRegistered,
     DelegationApproverUpdated,
     OperatorMetadataUpdate,
@@ -60,6 +61,7 @@ from .events import (
 __all__ = [
     "Base",
     "TimestampMixin",
+    "ImmutableEventMixin",
     "Operator",
     "Staker",
     "AVS",
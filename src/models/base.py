@@ -1,13 +1,126 @@
 # models/base.py
 from datetime import datetime
-from sqlalchemy import Column, DateTime, func
+import enum
+import time
+from typing import Any, Tuple, Type
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, func, text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 
 Base = declarative_base()
 
+# Engine settings shared by everything that writes these models.
+# Sized for concurrent event ingestion; behind pgbouncer (transaction mode)
+# these connections multiplex onto a handful of server backends.
+# psycopg (v3) server-side prepares a statement after it has run
+# `prepare_threshold` times on a connection; needs pgbouncer >= 1.21 with
+# max_prepared_statements set when running behind it.
+ENGINE_KW = {
+    "pool_size": 25,
+    "max_overflow": 25,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "connect_args": {"prepare_threshold": 5},
+}
+
+DRIVER_PREFIX = "postgresql+psycopg://"
+
+
+def engine_url(url: str) -> str:
+    """Rewrite any Postgres URL scheme to use the psycopg (v3) driver."""
+    scheme, sep, rest = url.partition("://")
+    if sep and scheme.split("+")[0] in ("postgres", "postgresql"):
+        return DRIVER_PREFIX + rest
+    return url
+
+
+# Postgres truncates identifiers longer than this, which can collide.
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def index_name(table_name: str, suffix: str, prefix: str = "ix") -> str:
+    """Build `<prefix>_<table>_<suffix>`, trimming the table part to fit."""
+    name = f"{prefix}_{table_name}_{suffix}"
+    if len(name) > MAX_IDENTIFIER_LENGTH:
+        keep = MAX_IDENTIFIER_LENGTH - len(prefix) - len(suffix) - 2
+        name = f"{prefix}_{table_name[:keep]}_{suffix}"
+    return name
+
 
 class TimestampMixin:
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
     )
+
+
+class ImmutableEventMixin:
+    """
+    Creation time for append-only rows, as unix seconds.
+    Filled Python-side (no server default, no onupdate), so inserts need no
+    RETURNING round-trip; events are never updated, hence no updated_at.
+    """
+
+    created_at = Column(BigInteger, nullable=False, default=lambda: int(time.time()))
+
+
+class CodedEnum(enum.IntEnum):
+    """
+    Enum persisted as a SMALLINT code.
+    Member names match the labels emitted by the subgraph.
+    """
+
+    @classmethod
+    def coerce(cls, value: Any) -> "CodedEnum":
+        """Accept a member, a subgraph label ("INCREASED") or a raw code."""
+        if isinstance(value, str):
+            return cls[value]
+        return cls(value)
+
+    @classmethod
+    def check_sql(cls, column: str) -> str:
+        """SQL predicate restricting `column` to the valid codes."""
+        codes = ", ".join(str(member.value) for member in cls)
+        return f"{column} IN ({codes})"
+
+    @classmethod
+    def partial_indexes(
+        cls, table_name: str, column: str, *indexed_columns: str
+    ) -> Tuple[Index, ...]:
+        """
+        One partial B-tree index per member, e.g. `WHERE event_type = 1`.
+        Queries always filter on a single type, so each index only holds the
+        rows it can serve.
+        """
+        return tuple(
+            Index(
+                index_name(table_name, member.name.lower()),
+                *indexed_columns,
+                postgresql_where=text(f"{column} = {member.value}"),
+            )
+            for member in cls
+        )
+
+
+def coded_enum_property(enum_cls: Type[CodedEnum], column_attr: str) -> hybrid_property:
+    """
+    Expose a SMALLINT code column as `enum_cls` members.
+
+    Usage:
+        _event_type = Column("event_type", SmallInteger, nullable=False)
+        event_type = coded_enum_property(ShareEventType, "_event_type")
+    """
+
+    def fget(self):
+        value = getattr(self, column_attr)
+        return None if value is None else enum_cls(value)
+
+    def fset(self, value):
+        setattr(self, column_attr, None if value is None else enum_cls.coerce(value))
+
+    def expr(cls):
+        return getattr(cls, column_attr)
+
+    return hybrid_property(fget, fset, expr=expr)
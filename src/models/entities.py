@@ -2,53 +2,53 @@
 from sqlalchemy import Column, String, BigInteger, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from .base import Base, TimestampMixin
-import enum
+from .base import Base, CodedEnum, TimestampMixin
 
 
 # Enums (collected from the schema)
-class ShareEventType(enum.Enum):
-    INCREASED = "INCREASED"
-    DECREASED = "DECREASED"
+# Stored as SMALLINT codes; never renumber an existing member.
+class ShareEventType(CodedEnum):
+    INCREASED = 1
+    DECREASED = 2
 
 
-class DelegationType(enum.Enum):
-    DELEGATED = "DELEGATED"
-    UNDELEGATED = "UNDELEGATED"
-    FORCE_UNDELEGATED = "FORCE_UNDELEGATED"
+class DelegationType(CodedEnum):
+    DELEGATED = 1
+    UNDELEGATED = 2
+    FORCE_UNDELEGATED = 3
 
 
-class WithdrawalEventType(enum.Enum):
-    QUEUED = "QUEUED"
-    COMPLETED = "COMPLETED"
+class WithdrawalEventType(CodedEnum):
+    QUEUED = 1
+    COMPLETED = 2
 
 
-class AVSRegistrationStatus(enum.Enum):
-    REGISTERED = "REGISTERED"
-    UNREGISTERED = "UNREGISTERED"
+class AVSRegistrationStatus(CodedEnum):
+    REGISTERED = 1
+    UNREGISTERED = 2
 
 
-class StrategyOperatorSetEventType(enum.Enum):
-    ADDED = "ADDED"
-    REMOVED = "REMOVED"
+class StrategyOperatorSetEventType(CodedEnum):
+    ADDED = 1
+    REMOVED = 2
 
 
-class RewardsSubmissionType(enum.Enum):
-    AVS_REWARDS = "AVS_REWARDS"
-    REWARDS_FOR_ALL = "REWARDS_FOR_ALL"
-    REWARDS_FOR_ALL_EARNERS = "REWARDS_FOR_ALL_EARNERS"
-    OPERATOR_DIRECTED_AVS = "OPERATOR_DIRECTED_AVS"
-    OPERATOR_DIRECTED_OPERATOR_SET = "OPERATOR_DIRECTED_OPERATOR_SET"
+class RewardsSubmissionType(CodedEnum):
+    AVS_REWARDS = 1
+    REWARDS_FOR_ALL = 2
+    REWARDS_FOR_ALL_EARNERS = 3
+    OPERATOR_DIRECTED_AVS = 4
+    OPERATOR_DIRECTED_OPERATOR_SET = 5
 
 
-class StrategyWhitelistEventType(enum.Enum):
-    ADDED = "ADDED"
-    REMOVED = "REMOVED"
+class StrategyWhitelistEventType(CodedEnum):
+    ADDED = 1
+    REMOVED = 2
 
 
-class PodSharesUpdateType(enum.Enum):
-    SHARES_UPDATED = "SHARES_UPDATED"
-    NEW_TOTAL_SHARES = "NEW_TOTAL_SHARES"
+class PodSharesUpdateType(CodedEnum):
+    SHARES_UPDATED = 1
+    NEW_TOTAL_SHARES = 2
 
 
 # Operator Table
@@ -59,24 +59,36 @@ class Operator(Base, TimestampMixin):
     id = Column(String, primary_key=True)  # operator address as string (hex)
     address = Column(String, nullable=False)
 
-    registration_events = relationship("OperatorRegistered", back_populates="operator")
-    share_events = relationship("OperatorShareEvent", back_populates="operator")
-    slashing_events = relationship("OperatorSlashed", back_populates="operator")
+    registration_events = relationship(
+        "OperatorRegistered", back_populates="operator", passive_deletes=True
+    )
+    share_events = relationship(
+        "OperatorShareEvent", back_populates="operator", passive_deletes=True
+    )
+    slashing_events = relationship(
+        "OperatorSlashed", back_populates="operator", passive_deletes=True
+    )
     avs_registration_events = relationship(
-        "OperatorAVSRegistrationStatusUpdated", back_populates="operator"
+        "OperatorAVSRegistrationStatusUpdated",
+        back_populates="operator",
+        passive_deletes=True,
     )
     operator_set_join_events = relationship(
-        "OperatorAddedToOperatorSet", back_populates="operator"
+        "OperatorAddedToOperatorSet", back_populates="operator", passive_deletes=True
     )
     operator_set_leave_events = relationship(
-        "OperatorRemovedFromOperatorSet", back_populates="operator"
+        "OperatorRemovedFromOperatorSet",
+        back_populates="operator",
+        passive_deletes=True,
+    )
+    allocation_events = relationship(
+        "AllocationEvent", back_populates="operator", passive_deletes=True
     )
-    allocation_events = relationship("AllocationEvent", back_populates="operator")
     metadata_update_events = relationship(
-        "OperatorMetadataUpdate", back_populates="operator"
+        "OperatorMetadataUpdate", back_populates="operator", passive_deletes=True
     )
     delegation_approver_updates = relationship(
-        "DelegationApproverUpdated", back_populates="operator"
+        "DelegationApproverUpdated", back_populates="operator", passive_deletes=True
     )
 
 
@@ -88,29 +100,39 @@ class Staker(Base, TimestampMixin):
     id = Column(String, primary_key=True)  # staker address as string (hex)
     address = Column(String, nullable=False)
 
-    eigen_pods = relationship("EigenPod", back_populates="owner")
-    delegation_events = relationship("StakerDelegationEvent", back_populates="staker")
-    share_events = relationship("OperatorShareEvent", back_populates="staker")
-    deposit_events = relationship("Deposit", back_populates="staker")
-    withdrawal_events = relationship("WithdrawalEvent", back_populates="staker")
-    pod_deployment_events = relationship("PodDeployed", back_populates="owner")
+    eigen_pods = relationship("EigenPod", back_populates="owner", passive_deletes=True)
+    delegation_events = relationship(
+        "StakerDelegationEvent", back_populates="staker", passive_deletes=True
+    )
+    share_events = relationship(
+        "OperatorShareEvent", back_populates="staker", passive_deletes=True
+    )
+    deposit_events = relationship(
+        "Deposit", back_populates="staker", passive_deletes=True
+    )
+    withdrawal_events = relationship(
+        "WithdrawalEvent", back_populates="staker", passive_deletes=True
+    )
+    pod_deployment_events = relationship(
+        "PodDeployed", back_populates="owner", passive_deletes=True
+    )
     beacon_chain_deposit_events = relationship(
-        "BeaconChainDeposit", back_populates="pod_owner"
+        "BeaconChainDeposit", back_populates="pod_owner", passive_deletes=True
     )
     beacon_chain_withdrawal_events = relationship(
-        "BeaconChainWithdrawal", back_populates="pod_owner"
+        "BeaconChainWithdrawal", back_populates="pod_owner", passive_deletes=True
     )
     pod_shares_update_events = relationship(
-        "PodSharesUpdate", back_populates="pod_owner"
+        "PodSharesUpdate", back_populates="pod_owner", passive_deletes=True
     )
     beacon_chain_slashing_events = relationship(
-        "BeaconChainSlashingEvent", back_populates="staker"
+        "BeaconChainSlashingEvent", back_populates="staker", passive_deletes=True
     )
     force_undelegation_events = relationship(
-        "StakerForceUndelegated", back_populates="staker"
+        "StakerForceUndelegated", back_populates="staker", passive_deletes=True
     )
     deposit_scaling_events = relationship(
-        "DepositScalingFactorUpdated", back_populates="staker"
+        "DepositScalingFactorUpdated", back_populates="staker", passive_deletes=True
     )
 
 
@@ -121,20 +143,32 @@ class AVS(Base, TimestampMixin):
     __tablename__ = "avs"
     id = Column(String, primary_key=True)  # avs address as string (hex)
     address = Column(String, nullable=False)
-    operator_sets = relationship("OperatorSet", back_populates="avs")
+    operator_sets = relationship(
+        "OperatorSet", back_populates="avs", passive_deletes=True
+    )
 
     operator_registration_events = relationship(
-        "OperatorAVSRegistrationStatusUpdated", back_populates="avs"
+        "OperatorAVSRegistrationStatusUpdated",
+        back_populates="avs",
+        passive_deletes=True,
+    )
+    rewards_submission_events = relationship(
+        "RewardsSubmission", back_populates="avs", passive_deletes=True
     )
-    rewards_submission_events = relationship("RewardsSubmission", back_populates="avs")
     operator_directed_rewards_events = relationship(
-        "OperatorDirectedAVSRewardsSubmission", back_populates="avs"
+        "OperatorDirectedAVSRewardsSubmission",
+        back_populates="avs",
+        passive_deletes=True,
+    )
+    metadata_update_events = relationship(
+        "AVSMetadataUpdate", back_populates="avs", passive_deletes=True
     )
-    metadata_update_events = relationship("AVSMetadataUpdate", back_populates="avs")
     operator_set_creation_events = relationship(
-        "OperatorSetCreated", back_populates="avs"
+        "OperatorSetCreated", back_populates="avs", passive_deletes=True
+    )
+    registrar_set_events = relationship(
+        "AVSRegistrarSet", back_populates="avs", passive_deletes=True
     )
-    registrar_set_events = relationship("AVSRegistrarSet", back_populates="avs")
 
 
 # Strategy Table
@@ -145,12 +179,20 @@ class Strategy(Base, TimestampMixin):
     id = Column(String, primary_key=True)  # strategy address as string (hex)
     address = Column(String, nullable=False)
 
-    deposit_events = relationship("Deposit", back_populates="strategy")
-    share_events = relationship("OperatorShareEvent", back_populates="strategy")
-    allocation_events = relationship("AllocationEvent", back_populates="strategy")
-    whitelist_events = relationship("StrategyWhitelistEvent", back_populates="strategy")
+    deposit_events = relationship(
+        "Deposit", back_populates="strategy", passive_deletes=True
+    )
+    share_events = relationship(
+        "OperatorShareEvent", back_populates="strategy", passive_deletes=True
+    )
+    allocation_events = relationship(
+        "AllocationEvent", back_populates="strategy", passive_deletes=True
+    )
+    whitelist_events = relationship(
+        "StrategyWhitelistEvent", back_populates="strategy", passive_deletes=True
+    )
     strategy_operator_set_events = relationship(
-        "StrategyOperatorSetEvent", back_populates="strategy"
+        "StrategyOperatorSetEvent", back_populates="strategy", passive_deletes=True
     )
 
 
@@ -166,23 +208,35 @@ class OperatorSet(Base, TimestampMixin):
     avs = relationship(
         "AVS", back_populates="operator_sets"
     )  # Note: adjusted for relationships
-    creation_event = relationship("OperatorSetCreated", back_populates="operator_set")
+    creation_event = relationship(
+        "OperatorSetCreated", back_populates="operator_set", passive_deletes=True
+    )
     member_join_events = relationship(
-        "OperatorAddedToOperatorSet", back_populates="operator_set"
+        "OperatorAddedToOperatorSet",
+        back_populates="operator_set",
+        passive_deletes=True,
     )
     member_leave_events = relationship(
-        "OperatorRemovedFromOperatorSet", back_populates="operator_set"
+        "OperatorRemovedFromOperatorSet",
+        back_populates="operator_set",
+        passive_deletes=True,
+    )
+    allocation_events = relationship(
+        "AllocationEvent", back_populates="operator_set", passive_deletes=True
+    )
+    slashing_events = relationship(
+        "OperatorSlashed", back_populates="operator_set", passive_deletes=True
     )
-    allocation_events = relationship("AllocationEvent", back_populates="operator_set")
-    slashing_events = relationship("OperatorSlashed", back_populates="operator_set")
     strategy_events = relationship(
-        "StrategyOperatorSetEvent", back_populates="operator_set"
+        "StrategyOperatorSetEvent", back_populates="operator_set", passive_deletes=True
     )
     redistribution_events = relationship(
-        "RedistributionAddressSet", back_populates="operator_set"
+        "RedistributionAddressSet", back_populates="operator_set", passive_deletes=True
     )
     operator_directed_rewards_events = relationship(
-        "OperatorDirectedOperatorSetRewardsSubmission", back_populates="operator_set"
+        "OperatorDirectedOperatorSetRewardsSubmission",
+        back_populates="operator_set",
+        passive_deletes=True,
     )
 
 
@@ -198,11 +252,15 @@ class EigenPod(Base, TimestampMixin):
     )
 
     owner = relationship("Staker", back_populates="eigen_pods")
-    deployment_event = relationship("PodDeployed", back_populates="pod")
+    deployment_event = relationship(
+        "PodDeployed", back_populates="pod", passive_deletes=True
+    )
     beacon_chain_deposit_events = relationship(
-        "BeaconChainDeposit", back_populates="pod"
+        "BeaconChainDeposit", back_populates="pod", passive_deletes=True
+    )
+    share_update_events = relationship(
+        "PodSharesUpdate", back_populates="pod", passive_deletes=True
     )
-    share_update_events = relationship("PodSharesUpdate", back_populates="pod")
     beacon_chain_withdrawal_events = relationship(
-        "BeaconChainWithdrawal", back_populates="pod"
+        "BeaconChainWithdrawal", back_populates="pod", passive_deletes=True
     )
@@ -1,8 +1,23 @@
 # models/events.py
-from sqlalchemy import Boolean, Column, String, BigInteger, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    Index,
+    Integer,
+    String,
+    BigInteger,
+    DDL,
+    SmallInteger,
+    ForeignKey,
+    and_,
+    event,
+)
+from sqlalchemy.orm import declared_attr, foreign, relationship
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from .base import Base, TimestampMixin
+from .base import Base, ImmutableEventMixin, coded_enum_property, index_name
 from .entities import (
     ShareEventType,
     DelegationType,
@@ -15,8 +30,28 @@ from .entities import (
 )
 
 
-class BaseEvent(Base, TimestampMixin):
+# EventRaw Table
+# Purpose: Cold storage for the full subgraph payload of every event (audit / schema evolution / re-processing).
+# Relationships: Keyed by (event table, event id), as subgraph ids are only unique per entity type;
+# read through BaseEvent.raw. No FK, as ids come from every event table.
+class EventRaw(Base):
+    __tablename__ = "event_raw"
+    table_name = Column(String, primary_key=True)
+    event_id = Column(String, primary_key=True)
+    raw_data = Column(JSONB, nullable=False)
+
+
+# Payloads are rarely read: store them out of line without TOAST compression.
+event.listen(
+    EventRaw.__table__,
+    "after_create",
+    DDL("ALTER TABLE event_raw ALTER COLUMN raw_data SET STORAGE EXTERNAL"),
+)
+
+
+class BaseEvent(Base, ImmutableEventMixin):
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": False}
 
     id = Column(String, primary_key=True)  # Usually txHash-logIndex or custom
     transaction_hash = Column(String, nullable=False)
@@ -25,47 +60,198 @@ class BaseEvent(Base, TimestampMixin):
     block_timestamp = Column(BigInteger, nullable=False)  # Unix timestamp
     contract_address = Column(String, nullable=False)
 
-    # ✅ Full raw payload for audit / schema evolution / re-processing
-    raw_data = Column(JSONB, nullable=False)
+    # ------------------------------------------------------------------ #
+    # Staging for bulk loads: COPY into an UNLOGGED twin (no WAL, no index
+    # maintenance per row), promote once with INSERT ... SELECT, truncate.
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def staging_table_name(cls) -> str:
+        return f"{cls.__tablename__}_stage"
+
+    @classmethod
+    def staging_ddl(cls) -> str:
+        """DDL creating the UNLOGGED staging twin of this table (idempotent)."""
+        return (
+            f"CREATE UNLOGGED TABLE IF NOT EXISTS {cls.staging_table_name()} "
+            f"(LIKE {cls.__tablename__} INCLUDING DEFAULTS)"
+        )
+
+    @classmethod
+    def promote_staging_sql(cls) -> str:
+        """Move staged rows into the live table, skipping ids already loaded."""
+        columns = ", ".join(column.name for column in cls.__table__.columns)
+        return (
+            f"INSERT INTO {cls.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM {cls.staging_table_name()} "
+            f"ON CONFLICT (id) DO NOTHING"
+        )
+
+    @classmethod
+    def truncate_staging_sql(cls) -> str:
+        return f"TRUNCATE {cls.staging_table_name()}"
+
+    # Full raw payload lives in event_raw to keep the hot table narrow.
+    # Load it explicitly (e.g. selectinload(Model.raw)); lazy access raises.
+    @declared_attr
+    def raw(cls):
+        return relationship(
+            EventRaw,
+            primaryjoin=lambda: and_(
+                foreign(EventRaw.event_id) == cls.id,
+                EventRaw.table_name == cls.__tablename__,
+            ),
+            uselist=False,
+            lazy="raise_on_sql",
+            viewonly=True,
+        )
+
+
+# Per-column statistics target for the entity FK columns of every event table.
+STATISTICS_COLUMNS = ("operator_id", "staker_id", "strategy_id")
+STATISTICS_TARGET = 1000
+
+
+@event.listens_for(BaseEvent, "instrument_class", propagate=True)
+def _add_event_table_indexes(mapper, cls):
+    """
+    Attach the indexes every event table shares.
+
+    `__table_args__` on the abstract base would be shadowed by subclasses
+    declaring their own, so they are added here as each model is mapped.
+    """
+    table = mapper.local_table
+
+    # Nothing is server-generated, so never ask for RETURNING on insert.
+    table.implicit_returning = False
+
+    # Lets the planner discard impossible ranges outright.
+    table.append_constraint(
+        CheckConstraint(
+            "log_index >= 0 AND block_number > 0",
+            name=index_name(table.name, "position", prefix="ck"),
+        )
+    )
+
+    # Entity columns are heavily skewed (a few operators / strategies hold
+    # most rows); a bigger sample gives the planner usable selectivities.
+    for column in STATISTICS_COLUMNS:
+        if column in table.c:
+            event.listen(
+                table,
+                "after_create",
+                DDL(
+                    f"ALTER TABLE {table.name} "
+                    f"ALTER COLUMN {column} SET STATISTICS {STATISTICS_TARGET}"
+                ),
+            )
+
+    # Resume cursor: ORDER BY block_number DESC, log_index DESC LIMIT 1 is a
+    # one-row backward scan of this index.
+    Index(
+        index_name(table.name, "block_log"),
+        table.c.block_number,
+        table.c.log_index,
+    )
+
+    # Append-only history: BRIN serves block / time range scans for a few KB,
+    # B-tree indexes stay reserved for per-entity lookups.
+    for column in ("block_number", "block_timestamp"):
+        Index(
+            index_name(table.name, f"{column}_brin"),
+            table.c[column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def get_event_model(table_name: str) -> type:
+    """Look up the BaseEvent subclass mapped to `table_name`."""
+    for mapper in Base.registry.mappers:
+        cls = mapper.class_
+        if issubclass(cls, BaseEvent) and cls.__tablename__ == table_name:
+            return cls
+    raise ValueError(f"Unknown event table: {table_name}")
+
+
+def make_event_model(
+    name: str,
+    table: str,
+    *,
+    fks: Dict[str, str],
+    extra_cols: Optional[Dict[str, Column]] = None,
+    relationships: Optional[Dict[str, Any]] = None,
+    table_args: Optional[Tuple[Any, ...]] = None,
+) -> type:
+    """
+    Build a BaseEvent model for the common "entity FKs + a few attributes" shape.
+
+    Args:
+        name: Class name (also the name used by string relationships)
+        table: Table name
+        fks: Column name -> "<table>.id" target; NOT NULL, ON DELETE CASCADE
+        extra_cols: Remaining columns (fresh Column objects per model)
+        relationships: Attribute name -> relationship(...)
+        table_args: Optional __table_args__ (indexes, constraints)
+
+    Returns:
+        The mapped model class
+    """
+    attrs: Dict[str, Any] = {"__tablename__": table, "__module__": __name__}
+    if table_args:
+        attrs["__table_args__"] = table_args
+
+    for column_name, target in fks.items():
+        attrs[column_name] = Column(
+            String, ForeignKey(target, ondelete="CASCADE"), nullable=False
+        )
+    attrs.update(extra_cols or {})
+    attrs.update(relationships or {})
+
+    return type(name, (BaseEvent,), attrs)
 
 
 # OperatorRegistered Event
 # Purpose: Captures operator registration events with delegation approver.
 # Relationships: Foreign key to Operator (cascade delete).
-class OperatorRegistered(BaseEvent):
-    __tablename__ = "operator_registered_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    delegation_approver = Column(String, nullable=False)
-
-    operator = relationship("Operator", back_populates="registration_events")
+OperatorRegistered = make_event_model(
+    "OperatorRegistered",
+    "operator_registered_events",
+    fks={"operator_id": "operators.id"},
+    extra_cols={"delegation_approver": Column(String, nullable=False)},
+    relationships={
+        "operator": relationship("Operator", back_populates="registration_events")
+    },
+)
 
 
 # DelegationApproverUpdated Event
 # Purpose: Records updates to an operator's delegation approver.
 # Relationships: Foreign key to Operator.
-class DelegationApproverUpdated(BaseEvent):
-    __tablename__ = "delegation_approver_updated_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    new_delegation_approver = Column(String, nullable=False)
-
-    operator = relationship("Operator", back_populates="delegation_approver_updates")
+DelegationApproverUpdated = make_event_model(
+    "DelegationApproverUpdated",
+    "delegation_approver_updated_events",
+    fks={"operator_id": "operators.id"},
+    extra_cols={"new_delegation_approver": Column(String, nullable=False)},
+    relationships={
+        "operator": relationship(
+            "Operator", back_populates="delegation_approver_updates"
+        ),
+    },
+)
 
 
 # OperatorMetadataUpdate Event
 # Purpose: Tracks metadata URI updates for operators.
 # Relationships: Foreign key to Operator.
-class OperatorMetadataUpdate(BaseEvent):
-    __tablename__ = "operator_metadata_update_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    metadata_uri = Column(String, nullable=False)
-
-    operator = relationship("Operator", back_populates="metadata_update_events")
+OperatorMetadataUpdate = make_event_model(
+    "OperatorMetadataUpdate",
+    "operator_metadata_update_events",
+    fks={"operator_id": "operators.id"},
+    extra_cols={"metadata_uri": Column(String, nullable=False)},
+    relationships={
+        "operator": relationship("Operator", back_populates="metadata_update_events")
+    },
+)
 
 
 # OperatorShareEvent Event
@@ -73,6 +259,22 @@ class OperatorMetadataUpdate(BaseEvent):
 # Relationships: Foreign keys to Operator, Staker, Strategy.
 class OperatorShareEvent(BaseEvent):
     __tablename__ = "operator_share_events"
+    __table_args__ = (
+        CheckConstraint(
+            ShareEventType.check_sql("event_type"),
+            name="ck_operator_share_events_event_type",
+        ),
+        *ShareEventType.partial_indexes(
+            "operator_share_events", "event_type", "operator_id", "block_number"
+        ),
+        # Covering index: per-operator share sums become index-only scans
+        Index(
+            "ix_operator_share_events_operator_id_agg",
+            "operator_id",
+            "block_number",
+            postgresql_include=["shares", "event_type"],
+        ),
+    )
     operator_id = Column(
         String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
     )
@@ -83,7 +285,10 @@ class OperatorShareEvent(BaseEvent):
         String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
     )
     shares = Column(BigInteger, nullable=False)
-    event_type = Column(SQLEnum(ShareEventType), nullable=False)
+    _event_type = Column(
+        "event_type", SmallInteger, nullable=False, info={"enum": ShareEventType}
+    )
+    event_type = coded_enum_property(ShareEventType, "_event_type")
 
     operator = relationship("Operator", back_populates="share_events")
     staker = relationship("Staker", back_populates="share_events")
@@ -95,51 +300,65 @@ class OperatorShareEvent(BaseEvent):
 # Relationships: Foreign keys to Staker, Operator.
 class StakerDelegationEvent(BaseEvent):
     __tablename__ = "staker_delegation_events"
+    __table_args__ = (
+        CheckConstraint(
+            DelegationType.check_sql("delegation_type"),
+            name="ck_staker_delegation_events_delegation_type",
+        ),
+        *DelegationType.partial_indexes(
+            "staker_delegation_events", "delegation_type", "operator_id", "block_number"
+        ),
+    )
     staker_id = Column(
         String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
     )
     operator_id = Column(
         String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
     )
-    delegation_type = Column(SQLEnum(DelegationType), nullable=False)
+    _delegation_type = Column(
+        "delegation_type", SmallInteger, nullable=False, info={"enum": DelegationType}
+    )
+    delegation_type = coded_enum_property(DelegationType, "_delegation_type")
 
     staker = relationship("Staker", back_populates="delegation_events")
     operator = relationship(
-        "Operator"
+        "Operator", viewonly=True
     )  # No back_populate as not in Operator relationships
 
 
 # StakerForceUndelegated Event
 # Purpose: Records forced undelegations of stakers from operators.
 # Relationships: Foreign keys to Staker, Operator.
-class StakerForceUndelegated(BaseEvent):
-    __tablename__ = "staker_force_undelegated_events"
-    staker_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-
-    staker = relationship("Staker", back_populates="force_undelegation_events")
-    operator = relationship("Operator")
+StakerForceUndelegated = make_event_model(
+    "StakerForceUndelegated",
+    "staker_force_undelegated_events",
+    fks={
+        "staker_id": "stakers.id",
+        "operator_id": "operators.id",
+    },
+    relationships={
+        "staker": relationship("Staker", back_populates="force_undelegation_events"),
+        "operator": relationship("Operator", viewonly=True),
+    },
+)
 
 
 # DepositScalingFactorUpdated Event
 # Purpose: Tracks updates to deposit scaling factors for stakers in strategies.
 # Relationships: Foreign keys to Staker, Strategy.
-class DepositScalingFactorUpdated(BaseEvent):
-    __tablename__ = "deposit_scaling_factor_updated_events"
-    staker_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    new_deposit_scaling_factor = Column(BigInteger, nullable=False)
-
-    staker = relationship("Staker", back_populates="deposit_scaling_events")
-    strategy = relationship("Strategy")
+DepositScalingFactorUpdated = make_event_model(
+    "DepositScalingFactorUpdated",
+    "deposit_scaling_factor_updated_events",
+    fks={
+        "staker_id": "stakers.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={"new_deposit_scaling_factor": Column(BigInteger, nullable=False)},
+    relationships={
+        "staker": relationship("Staker", back_populates="deposit_scaling_events"),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+)
 
 
 # WithdrawalEvent Event
@@ -147,109 +366,142 @@ class DepositScalingFactorUpdated(BaseEvent):
 # Relationships: Foreign keys to Staker, Operator (delegatedTo).
 class WithdrawalEvent(BaseEvent):
     __tablename__ = "withdrawal_events"
+    __table_args__ = (
+        CheckConstraint(
+            WithdrawalEventType.check_sql("event_type"),
+            name="ck_withdrawal_events_event_type",
+        ),
+        *WithdrawalEventType.partial_indexes(
+            "withdrawal_events", "event_type", "staker_id", "block_number"
+        ),
+    )
     withdrawal_root = Column(String, nullable=False)
     staker_id = Column(
         String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
     )
     delegated_to_id = Column(String, ForeignKey("operators.id", ondelete="CASCADE"))
     withdrawer = Column(String, nullable=False)
-    nonce = Column(BigInteger, nullable=False)
+    nonce = Column(Integer, nullable=False)
     start_block = Column(BigInteger)
     strategies = Column(
         ARRAY(String), nullable=False
     )  # Array of strategy addresses (as strings)
     shares = Column(ARRAY(BigInteger), nullable=False)
-    event_type = Column(SQLEnum(WithdrawalEventType), nullable=False)
+    _event_type = Column(
+        "event_type", SmallInteger, nullable=False, info={"enum": WithdrawalEventType}
+    )
+    event_type = coded_enum_property(WithdrawalEventType, "_event_type")
 
     staker = relationship("Staker", back_populates="withdrawal_events")
-    delegated_to = relationship("Operator")
+    delegated_to = relationship("Operator", viewonly=True)
 
 
 # OperatorSharesSlashed Event
 # Purpose: Records slashing of operator shares in strategies.
 # Relationships: Foreign keys to Operator, Strategy.
-class OperatorSharesSlashed(BaseEvent):
-    __tablename__ = "operator_shares_slashed_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    total_slashed_shares = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
-    strategy = relationship("Strategy")
+OperatorSharesSlashed = make_event_model(
+    "OperatorSharesSlashed",
+    "operator_shares_slashed_events",
+    fks={
+        "operator_id": "operators.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={"total_slashed_shares": Column(BigInteger, nullable=False)},
+    relationships={
+        "operator": relationship("Operator", viewonly=True),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+    table_args=(
+        Index(
+            "ix_operator_shares_slashed_events_operator_id_agg",
+            "operator_id",
+            "block_number",
+            postgresql_include=["total_slashed_shares"],
+        ),
+    ),
+)
 
 
 # AllocationDelaySet Event
 # Purpose: Sets allocation delays for operators.
 # Relationships: Foreign key to Operator.
-class AllocationDelaySet(BaseEvent):
-    __tablename__ = "allocation_delay_set_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    delay = Column(BigInteger, nullable=False)
-    effect_block = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
+AllocationDelaySet = make_event_model(
+    "AllocationDelaySet",
+    "allocation_delay_set_events",
+    fks={"operator_id": "operators.id"},
+    extra_cols={
+        "delay": Column(Integer, nullable=False),
+        "effect_block": Column(Integer, nullable=False),
+    },
+    relationships={"operator": relationship("Operator", viewonly=True)},
+)
 
 
 # AllocationEvent Event
 # Purpose: Records allocation changes for operators in operator sets and strategies.
 # Relationships: Foreign keys to Operator, OperatorSet, Strategy.
-class AllocationEvent(BaseEvent):
-    __tablename__ = "allocation_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    magnitude = Column(BigInteger, nullable=False)
-    effect_block = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator", back_populates="allocation_events")
-    operator_set = relationship("OperatorSet", back_populates="allocation_events")
-    strategy = relationship("Strategy", back_populates="allocation_events")
+AllocationEvent = make_event_model(
+    "AllocationEvent",
+    "allocation_events",
+    fks={
+        "operator_id": "operators.id",
+        "operator_set_id": "operator_sets.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={
+        "magnitude": Column(BigInteger, nullable=False),
+        "effect_block": Column(Integer, nullable=False),
+    },
+    relationships={
+        "operator": relationship("Operator", back_populates="allocation_events"),
+        "operator_set": relationship("OperatorSet", back_populates="allocation_events"),
+        "strategy": relationship("Strategy", back_populates="allocation_events"),
+    },
+    table_args=(
+        Index(
+            "ix_allocation_events_operator_id_agg",
+            "operator_id",
+            "block_number",
+            postgresql_include=["magnitude"],
+        ),
+    ),
+)
 
 
 # EncumberedMagnitudeUpdated Event
 # Purpose: Updates encumbered magnitudes for operators in strategies.
 # Relationships: Foreign keys to Operator, Strategy.
-class EncumberedMagnitudeUpdated(BaseEvent):
-    __tablename__ = "encumbered_magnitude_updated_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    encumbered_magnitude = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
-    strategy = relationship("Strategy")
+EncumberedMagnitudeUpdated = make_event_model(
+    "EncumberedMagnitudeUpdated",
+    "encumbered_magnitude_updated_events",
+    fks={
+        "operator_id": "operators.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={"encumbered_magnitude": Column(BigInteger, nullable=False)},
+    relationships={
+        "operator": relationship("Operator", viewonly=True),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+)
 
 
 # MaxMagnitudeUpdated Event
 # Purpose: Updates max magnitudes for operators in strategies.
 # Relationships: Foreign keys to Operator, Strategy.
-class MaxMagnitudeUpdated(BaseEvent):
-    __tablename__ = "max_magnitude_updated_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    max_magnitude = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
-    strategy = relationship("Strategy")
+MaxMagnitudeUpdated = make_event_model(
+    "MaxMagnitudeUpdated",
+    "max_magnitude_updated_events",
+    fks={
+        "operator_id": "operators.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={"max_magnitude": Column(BigInteger, nullable=False)},
+    relationships={
+        "operator": relationship("Operator", viewonly=True),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+)
 
 
 # OperatorSlashed Event
@@ -274,85 +526,102 @@ class OperatorSlashed(BaseEvent):
 # AVSRegistrarSet Event
 # Purpose: Sets registrars for AVS.
 # Relationships: Foreign key to AVS.
-class AVSRegistrarSet(BaseEvent):
-    __tablename__ = "avs_registrar_set_events"
-    avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
-    registrar = Column(String, nullable=False)
-
-    avs = relationship("AVS", back_populates="registrar_set_events")
+AVSRegistrarSet = make_event_model(
+    "AVSRegistrarSet",
+    "avs_registrar_set_events",
+    fks={"avs_id": "avs.id"},
+    extra_cols={"registrar": Column(String, nullable=False)},
+    relationships={"avs": relationship("AVS", back_populates="registrar_set_events")},
+)
 
 
 # AVSMetadataUpdate Event
 # Purpose: Tracks metadata URI updates for AVS.
 # Relationships: Foreign key to AVS.
-class AVSMetadataUpdate(BaseEvent):
-    __tablename__ = "avs_metadata_update_events"
-    avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
-    metadata_uri = Column(String, nullable=False)
-
-    avs = relationship("AVS", back_populates="metadata_update_events")
+AVSMetadataUpdate = make_event_model(
+    "AVSMetadataUpdate",
+    "avs_metadata_update_events",
+    fks={"avs_id": "avs.id"},
+    extra_cols={"metadata_uri": Column(String, nullable=False)},
+    relationships={"avs": relationship("AVS", back_populates="metadata_update_events")},
+)
 
 
 # OperatorSetCreated Event
 # Purpose: Records creation of new operator sets for AVS.
 # Relationships: Foreign keys to OperatorSet, AVS.
-class OperatorSetCreated(BaseEvent):
-    __tablename__ = "operator_set_created_events"
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
-    operator_set_id_num = Column(
-        BigInteger, nullable=False
-    )  # Renamed to avoid conflict
-
-    operator_set = relationship("OperatorSet", back_populates="creation_event")
-    avs = relationship("AVS", back_populates="operator_set_creation_events")
+OperatorSetCreated = make_event_model(
+    "OperatorSetCreated",
+    "operator_set_created_events",
+    fks={
+        "operator_set_id": "operator_sets.id",
+        "avs_id": "avs.id",
+    },
+    extra_cols={
+        # Renamed to avoid conflict
+        "operator_set_id_num": Column(BigInteger, nullable=False),
+    },
+    relationships={
+        "operator_set": relationship("OperatorSet", back_populates="creation_event"),
+        "avs": relationship("AVS", back_populates="operator_set_creation_events"),
+    },
+)
 
 
 # OperatorAddedToOperatorSet Event
 # Purpose: Adds operators to operator sets.
 # Relationships: Foreign keys to Operator, OperatorSet.
-class OperatorAddedToOperatorSet(BaseEvent):
-    __tablename__ = "operator_added_to_operator_set_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-
-    operator = relationship("Operator", back_populates="operator_set_join_events")
-    operator_set = relationship("OperatorSet", back_populates="member_join_events")
+OperatorAddedToOperatorSet = make_event_model(
+    "OperatorAddedToOperatorSet",
+    "operator_added_to_operator_set_events",
+    fks={
+        "operator_id": "operators.id",
+        "operator_set_id": "operator_sets.id",
+    },
+    relationships={
+        "operator": relationship("Operator", back_populates="operator_set_join_events"),
+        "operator_set": relationship(
+            "OperatorSet", back_populates="member_join_events"
+        ),
+    },
+)
 
 
 # OperatorRemovedFromOperatorSet Event
 # Purpose: Removes operators from operator sets.
 # Relationships: Foreign keys to Operator, OperatorSet.
-class OperatorRemovedFromOperatorSet(BaseEvent):
-    __tablename__ = "operator_removed_from_operator_set_events"
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-
-    operator = relationship("Operator", back_populates="operator_set_leave_events")
-    operator_set = relationship("OperatorSet", back_populates="member_leave_events")
+OperatorRemovedFromOperatorSet = make_event_model(
+    "OperatorRemovedFromOperatorSet",
+    "operator_removed_from_operator_set_events",
+    fks={
+        "operator_id": "operators.id",
+        "operator_set_id": "operator_sets.id",
+    },
+    relationships={
+        "operator": relationship(
+            "Operator", back_populates="operator_set_leave_events"
+        ),
+        "operator_set": relationship(
+            "OperatorSet", back_populates="member_leave_events"
+        ),
+    },
+)
 
 
 # RedistributionAddressSet Event
 # Purpose: Sets redistribution addresses for operator sets.
 # Relationships: Foreign key to OperatorSet.
-class RedistributionAddressSet(BaseEvent):
-    __tablename__ = "redistribution_address_set_events"
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    redistribution_recipient = Column(String, nullable=False)
-
-    operator_set = relationship("OperatorSet", back_populates="redistribution_events")
+RedistributionAddressSet = make_event_model(
+    "RedistributionAddressSet",
+    "redistribution_address_set_events",
+    fks={"operator_set_id": "operator_sets.id"},
+    extra_cols={"redistribution_recipient": Column(String, nullable=False)},
+    relationships={
+        "operator_set": relationship(
+            "OperatorSet", back_populates="redistribution_events"
+        ),
+    },
+)
 
 
 # StrategyOperatorSetEvent Event
@@ -360,13 +629,31 @@ class RedistributionAddressSet(BaseEvent):
 # Relationships: Foreign keys to OperatorSet, Strategy.
 class StrategyOperatorSetEvent(BaseEvent):
     __tablename__ = "strategy_operator_set_events"
+    __table_args__ = (
+        CheckConstraint(
+            StrategyOperatorSetEventType.check_sql("event_type"),
+            name="ck_strategy_operator_set_events_event_type",
+        ),
+        *StrategyOperatorSetEventType.partial_indexes(
+            "strategy_operator_set_events",
+            "event_type",
+            "operator_set_id",
+            "block_number",
+        ),
+    )
     operator_set_id = Column(
         String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
     )
     strategy_id = Column(
         String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
     )
-    event_type = Column(SQLEnum(StrategyOperatorSetEventType), nullable=False)
+    _event_type = Column(
+        "event_type",
+        SmallInteger,
+        nullable=False,
+        info={"enum": StrategyOperatorSetEventType},
+    )
+    event_type = coded_enum_property(StrategyOperatorSetEventType, "_event_type")
 
     operator_set = relationship("OperatorSet", back_populates="strategy_events")
     strategy = relationship("Strategy", back_populates="strategy_operator_set_events")
@@ -377,11 +664,23 @@ class StrategyOperatorSetEvent(BaseEvent):
 # Relationships: Foreign key to AVS (optional).
 class RewardsSubmission(BaseEvent):
     __tablename__ = "rewards_submission_events"
+    __table_args__ = (
+        CheckConstraint(
+            RewardsSubmissionType.check_sql("submission_type"),
+            name="ck_rewards_submission_events_submission_type",
+        ),
+    )
     avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"))
     submitter = Column(String, nullable=False)
-    submission_nonce = Column(BigInteger, nullable=False)
+    submission_nonce = Column(Integer, nullable=False)
     rewards_submission_hash = Column(String, nullable=False)
-    submission_type = Column(SQLEnum(RewardsSubmissionType), nullable=False)
+    _submission_type = Column(
+        "submission_type",
+        SmallInteger,
+        nullable=False,
+        info={"enum": RewardsSubmissionType},
+    )
+    submission_type = coded_enum_property(RewardsSubmissionType, "_submission_type")
     strategies_and_multipliers = Column(JSONB, nullable=False)
     token = Column(String, nullable=False)
     amount = Column(BigInteger, nullable=False)
@@ -399,7 +698,7 @@ class OperatorDirectedAVSRewardsSubmission(BaseEvent):
     caller = Column(String, nullable=False)
     avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
     operator_directed_rewards_submission_hash = Column(String, nullable=False)
-    submission_nonce = Column(BigInteger, nullable=False)
+    submission_nonce = Column(Integer, nullable=False)
     strategies_and_multipliers = Column(JSONB, nullable=False)
     token = Column(String, nullable=False)
     operator_rewards = Column(JSONB, nullable=False)
@@ -420,7 +719,7 @@ class OperatorDirectedOperatorSetRewardsSubmission(BaseEvent):
     operator_set_id = Column(
         String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
     )
-    submission_nonce = Column(BigInteger, nullable=False)
+    submission_nonce = Column(Integer, nullable=False)
     strategies_and_multipliers = Column(JSONB, nullable=False)
     token = Column(String, nullable=False)
     operator_rewards = Column(JSONB, nullable=False)
@@ -466,62 +765,71 @@ class ActivationDelaySet(BaseEvent):
 # Relationships: No entity references.
 class DefaultOperatorSplitBipsSet(BaseEvent):
     __tablename__ = "default_operator_split_bips_set_events"
-    old_default_operator_split_bips = Column(BigInteger, nullable=False)
-    new_default_operator_split_bips = Column(BigInteger, nullable=False)
+    old_default_operator_split_bips = Column(SmallInteger, nullable=False)
+    new_default_operator_split_bips = Column(SmallInteger, nullable=False)
 
 
 # OperatorAVSSplitBipsSet Event
 # Purpose: Sets operator AVS split basis points.
 # Relationships: Foreign keys to Operator, AVS.
-class OperatorAVSSplitBipsSet(BaseEvent):
-    __tablename__ = "operator_avs_split_bips_set_events"
-    caller = Column(String, nullable=False)
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
-    activated_at = Column(BigInteger, nullable=False)
-    old_operator_avs_split_bips = Column(BigInteger, nullable=False)
-    new_operator_avs_split_bips = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
-    avs = relationship("AVS")
+OperatorAVSSplitBipsSet = make_event_model(
+    "OperatorAVSSplitBipsSet",
+    "operator_avs_split_bips_set_events",
+    fks={
+        "operator_id": "operators.id",
+        "avs_id": "avs.id",
+    },
+    extra_cols={
+        "caller": Column(String, nullable=False),
+        "activated_at": Column(BigInteger, nullable=False),
+        "old_operator_avs_split_bips": Column(SmallInteger, nullable=False),
+        "new_operator_avs_split_bips": Column(SmallInteger, nullable=False),
+    },
+    relationships={
+        "operator": relationship("Operator", viewonly=True),
+        "avs": relationship("AVS", viewonly=True),
+    },
+)
 
 
 # OperatorPISplitBipsSet Event
 # Purpose: Sets operator PI split basis points.
 # Relationships: Foreign key to Operator.
-class OperatorPISplitBipsSet(BaseEvent):
-    __tablename__ = "operator_pi_split_bips_set_events"
-    caller = Column(String, nullable=False)
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    activated_at = Column(BigInteger, nullable=False)
-    old_operator_pi_split_bips = Column(BigInteger, nullable=False)
-    new_operator_pi_split_bips = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
+OperatorPISplitBipsSet = make_event_model(
+    "OperatorPISplitBipsSet",
+    "operator_pi_split_bips_set_events",
+    fks={"operator_id": "operators.id"},
+    extra_cols={
+        "caller": Column(String, nullable=False),
+        "activated_at": Column(BigInteger, nullable=False),
+        "old_operator_pi_split_bips": Column(SmallInteger, nullable=False),
+        "new_operator_pi_split_bips": Column(SmallInteger, nullable=False),
+    },
+    relationships={"operator": relationship("Operator", viewonly=True)},
+)
 
 
 # OperatorSetSplitBipsSet Event
 # Purpose: Sets operator set split basis points.
 # Relationships: Foreign keys to Operator, OperatorSet.
-class OperatorSetSplitBipsSet(BaseEvent):
-    __tablename__ = "operator_set_split_bips_set_events"
-    caller = Column(String, nullable=False)
-    operator_id = Column(
-        String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
-    )
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    activated_at = Column(BigInteger, nullable=False)
-    old_operator_set_split_bips = Column(BigInteger, nullable=False)
-    new_operator_set_split_bips = Column(BigInteger, nullable=False)
-
-    operator = relationship("Operator")
-    operator_set = relationship("OperatorSet")
+OperatorSetSplitBipsSet = make_event_model(
+    "OperatorSetSplitBipsSet",
+    "operator_set_split_bips_set_events",
+    fks={
+        "operator_id": "operators.id",
+        "operator_set_id": "operator_sets.id",
+    },
+    extra_cols={
+        "caller": Column(String, nullable=False),
+        "activated_at": Column(BigInteger, nullable=False),
+        "old_operator_set_split_bips": Column(SmallInteger, nullable=False),
+        "new_operator_set_split_bips": Column(SmallInteger, nullable=False),
+    },
+    relationships={
+        "operator": relationship("Operator", viewonly=True),
+        "operator_set": relationship("OperatorSet", viewonly=True),
+    },
+)
 
 
 # ClaimerForSet Event
@@ -539,7 +847,7 @@ class ClaimerForSet(BaseEvent):
 # Relationships: No entity references.
 class DistributionRootSubmitted(BaseEvent):
     __tablename__ = "distribution_root_submitted_events"
-    root_index = Column(BigInteger, nullable=False)
+    root_index = Column(Integer, nullable=False)
     root = Column(String, nullable=False)
     rewards_calculation_end_timestamp = Column(BigInteger, nullable=False)
     activated_at = Column(BigInteger, nullable=False)
@@ -550,7 +858,7 @@ class DistributionRootSubmitted(BaseEvent):
 # Relationships: No entity references.
 class DistributionRootDisabled(BaseEvent):
     __tablename__ = "distribution_root_disabled_events"
-    root_index = Column(BigInteger, nullable=False)
+    root_index = Column(Integer, nullable=False)
 
 
 # RewardsClaimed Event
@@ -569,18 +877,27 @@ class RewardsClaimed(BaseEvent):
 # Deposit Event
 # Purpose: Captures deposits into strategies by stakers.
 # Relationships: Foreign keys to Staker, Strategy.
-class Deposit(BaseEvent):
-    __tablename__ = "deposit_events"
-    staker_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-
-    staker = relationship("Staker", back_populates="deposit_events")
-    strategy = relationship("Strategy", back_populates="deposit_events")
+Deposit = make_event_model(
+    "Deposit",
+    "deposit_events",
+    fks={
+        "staker_id": "stakers.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={"shares": Column(BigInteger, nullable=False)},
+    relationships={
+        "staker": relationship("Staker", back_populates="deposit_events"),
+        "strategy": relationship("Strategy", back_populates="deposit_events"),
+    },
+    table_args=(
+        Index(
+            "ix_deposit_events_staker_id_agg",
+            "staker_id",
+            "block_number",
+            postgresql_include=["shares"],
+        ),
+    ),
+)
 
 
 # StrategyWhitelisterChanged Event
@@ -597,10 +914,22 @@ class StrategyWhitelisterChanged(BaseEvent):
 # Relationships: Foreign key to Strategy.
 class StrategyWhitelistEvent(BaseEvent):
     __tablename__ = "strategy_whitelist_events"
+    __table_args__ = (
+        CheckConstraint(
+            StrategyWhitelistEventType.check_sql("event_type"),
+            name="ck_strategy_whitelist_events_event_type",
+        ),
+    )
     strategy_id = Column(
         String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
     )
-    event_type = Column(SQLEnum(StrategyWhitelistEventType), nullable=False)
+    _event_type = Column(
+        "event_type",
+        SmallInteger,
+        nullable=False,
+        info={"enum": StrategyWhitelistEventType},
+    )
+    event_type = coded_enum_property(StrategyWhitelistEventType, "_event_type")
 
     strategy = relationship("Strategy", back_populates="whitelist_events")
 
@@ -608,50 +937,55 @@ class StrategyWhitelistEvent(BaseEvent):
 # BurnOrRedistributableSharesIncreased Event
 # Purpose: Increases burn or redistributable shares for operator sets.
 # Relationships: Foreign keys to OperatorSet, Strategy.
-class BurnOrRedistributableSharesIncreased(BaseEvent):
-    __tablename__ = "burn_or_redistributable_shares_increased_events"
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    slash_id = Column(BigInteger, nullable=False)
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-
-    operator_set = relationship("OperatorSet")
-    strategy = relationship("Strategy")
+BurnOrRedistributableSharesIncreased = make_event_model(
+    "BurnOrRedistributableSharesIncreased",
+    "burn_or_redistributable_shares_increased_events",
+    fks={
+        "operator_set_id": "operator_sets.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={
+        "slash_id": Column(Integer, nullable=False),
+        "shares": Column(BigInteger, nullable=False),
+    },
+    relationships={
+        "operator_set": relationship("OperatorSet", viewonly=True),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+)
 
 
 # BurnOrRedistributableSharesDecreased Event
 # Purpose: Decreases burn or redistributable shares for operator sets.
 # Relationships: Foreign keys to OperatorSet, Strategy.
-class BurnOrRedistributableSharesDecreased(BaseEvent):
-    __tablename__ = "burn_or_redistributable_shares_decreased_events"
-    operator_set_id = Column(
-        String, ForeignKey("operator_sets.id", ondelete="CASCADE"), nullable=False
-    )
-    slash_id = Column(BigInteger, nullable=False)
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-
-    operator_set = relationship("OperatorSet")
-    strategy = relationship("Strategy")
+BurnOrRedistributableSharesDecreased = make_event_model(
+    "BurnOrRedistributableSharesDecreased",
+    "burn_or_redistributable_shares_decreased_events",
+    fks={
+        "operator_set_id": "operator_sets.id",
+        "strategy_id": "strategies.id",
+    },
+    extra_cols={
+        "slash_id": Column(Integer, nullable=False),
+        "shares": Column(BigInteger, nullable=False),
+    },
+    relationships={
+        "operator_set": relationship("OperatorSet", viewonly=True),
+        "strategy": relationship("Strategy", viewonly=True),
+    },
+)
 
 
 # BurnableSharesDecreased Event
 # Purpose: Decreases burnable shares for strategies.
 # Relationships: Foreign key to Strategy.
-class BurnableSharesDecreased(BaseEvent):
-    __tablename__ = "burnable_shares_decreased_events"
-    strategy_id = Column(
-        String, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-
-    strategy = relationship("Strategy")
+BurnableSharesDecreased = make_event_model(
+    "BurnableSharesDecreased",
+    "burnable_shares_decreased_events",
+    fks={"strategy_id": "strategies.id"},
+    extra_cols={"shares": Column(BigInteger, nullable=False)},
+    relationships={"strategy": relationship("Strategy", viewonly=True)},
+)
 
 
 # OperatorAVSRegistrationStatusUpdated Event
@@ -659,11 +993,20 @@ class BurnableSharesDecreased(BaseEvent):
 # Relationships: Foreign keys to Operator, AVS.
 class OperatorAVSRegistrationStatusUpdated(BaseEvent):
     __tablename__ = "operator_avs_registration_status_updated_events"
+    __table_args__ = (
+        CheckConstraint(
+            AVSRegistrationStatus.check_sql("status"),
+            name="ck_operator_avs_registration_status_updated_events_status",
+        ),
+    )
     operator_id = Column(
         String, ForeignKey("operators.id", ondelete="CASCADE"), nullable=False
     )
     avs_id = Column(String, ForeignKey("avs.id", ondelete="CASCADE"), nullable=False)
-    status = Column(SQLEnum(AVSRegistrationStatus), nullable=False)
+    _status = Column(
+        "status", SmallInteger, nullable=False, info={"enum": AVSRegistrationStatus}
+    )
+    status = coded_enum_property(AVSRegistrationStatus, "_status")
 
     operator = relationship("Operator", back_populates="avs_registration_events")
     avs = relationship("AVS", back_populates="operator_registration_events")
@@ -672,32 +1015,38 @@ class OperatorAVSRegistrationStatusUpdated(BaseEvent):
 # PodDeployed Event
 # Purpose: Deploys EigenPods for stakers.
 # Relationships: Foreign keys to EigenPod, Staker.
-class PodDeployed(BaseEvent):
-    __tablename__ = "pod_deployed_events"
-    pod_id = Column(
-        String, ForeignKey("eigen_pods.id", ondelete="CASCADE"), nullable=False
-    )
-    owner_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-
-    pod = relationship("EigenPod", back_populates="deployment_event")
-    owner = relationship("Staker", back_populates="pod_deployment_events")
+PodDeployed = make_event_model(
+    "PodDeployed",
+    "pod_deployed_events",
+    fks={
+        "pod_id": "eigen_pods.id",
+        "owner_id": "stakers.id",
+    },
+    relationships={
+        "pod": relationship("EigenPod", back_populates="deployment_event"),
+        "owner": relationship("Staker", back_populates="pod_deployment_events"),
+    },
+)
 
 
 # BeaconChainDeposit Event
 # Purpose: Deposits on beacon chain for pods.
 # Relationships: Foreign keys to EigenPod, Staker.
-class BeaconChainDeposit(BaseEvent):
-    __tablename__ = "beacon_chain_deposit_events"
-    pod_id = Column(String, ForeignKey("eigen_pods.id", ondelete="CASCADE"))
-    pod_owner_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    amount = Column(BigInteger, nullable=False)
-
-    pod = relationship("EigenPod", back_populates="beacon_chain_deposit_events")
-    pod_owner = relationship("Staker", back_populates="beacon_chain_deposit_events")
+BeaconChainDeposit = make_event_model(
+    "BeaconChainDeposit",
+    "beacon_chain_deposit_events",
+    fks={"pod_owner_id": "stakers.id"},
+    extra_cols={
+        "pod_id": Column(String, ForeignKey("eigen_pods.id", ondelete="CASCADE")),
+        "amount": Column(BigInteger, nullable=False),
+    },
+    relationships={
+        "pod": relationship("EigenPod", back_populates="beacon_chain_deposit_events"),
+        "pod_owner": relationship(
+            "Staker", back_populates="beacon_chain_deposit_events"
+        ),
+    },
+)
 
 
 # PodSharesUpdate Event
@@ -705,13 +1054,28 @@ class BeaconChainDeposit(BaseEvent):
 # Relationships: Foreign keys to EigenPod, Staker.
 class PodSharesUpdate(BaseEvent):
     __tablename__ = "pod_shares_update_events"
+    __table_args__ = (
+        CheckConstraint(
+            PodSharesUpdateType.check_sql("update_type"),
+            name="ck_pod_shares_update_events_update_type",
+        ),
+        Index(
+            "ix_pod_shares_update_events_pod_owner_id_agg",
+            "pod_owner_id",
+            "block_number",
+            postgresql_include=["shares_delta", "new_total_shares"],
+        ),
+    )
     pod_id = Column(String, ForeignKey("eigen_pods.id", ondelete="CASCADE"))
     pod_owner_id = Column(
         String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
     )
     shares_delta = Column(BigInteger, nullable=False)
     new_total_shares = Column(BigInteger)
-    update_type = Column(SQLEnum(PodSharesUpdateType), nullable=False)
+    _update_type = Column(
+        "update_type", SmallInteger, nullable=False, info={"enum": PodSharesUpdateType}
+    )
+    update_type = coded_enum_property(PodSharesUpdateType, "_update_type")
 
     pod = relationship("EigenPod", back_populates="share_update_events")
     pod_owner = relationship("Staker", back_populates="pod_shares_update_events")
@@ -720,51 +1084,62 @@ class PodSharesUpdate(BaseEvent):
 # BeaconChainWithdrawal Event
 # Purpose: Withdrawals on beacon chain for pods.
 # Relationships: Foreign keys to EigenPod, Staker.
-class BeaconChainWithdrawal(BaseEvent):
-    __tablename__ = "beacon_chain_withdrawal_events"
-    pod_id = Column(String, ForeignKey("eigen_pods.id", ondelete="CASCADE"))
-    pod_owner_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-    nonce = Column(BigInteger, nullable=False)
-    delegated_address = Column(String, nullable=False)
-    withdrawer = Column(String, nullable=False)
-    withdrawal_root = Column(String, nullable=False)
-
-    pod = relationship("EigenPod", back_populates="beacon_chain_withdrawal_events")
-    pod_owner = relationship("Staker", back_populates="beacon_chain_withdrawal_events")
+BeaconChainWithdrawal = make_event_model(
+    "BeaconChainWithdrawal",
+    "beacon_chain_withdrawal_events",
+    fks={"pod_owner_id": "stakers.id"},
+    extra_cols={
+        "pod_id": Column(String, ForeignKey("eigen_pods.id", ondelete="CASCADE")),
+        "shares": Column(BigInteger, nullable=False),
+        "nonce": Column(Integer, nullable=False),
+        "delegated_address": Column(String, nullable=False),
+        "withdrawer": Column(String, nullable=False),
+        "withdrawal_root": Column(String, nullable=False),
+    },
+    relationships={
+        "pod": relationship(
+            "EigenPod", back_populates="beacon_chain_withdrawal_events"
+        ),
+        "pod_owner": relationship(
+            "Staker", back_populates="beacon_chain_withdrawal_events"
+        ),
+    },
+)
 
 
 # BeaconChainETHWithdrawalCompleted Event
 # Purpose: Completes ETH withdrawals on beacon chain.
 # Relationships: Foreign key to Staker.
-class BeaconChainETHWithdrawalCompleted(BaseEvent):
-    __tablename__ = "beacon_chain_eth_withdrawal_completed_events"
-    pod_owner_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    shares = Column(BigInteger, nullable=False)
-    nonce = Column(BigInteger, nullable=False)
-    delegated_address = Column(String, nullable=False)
-    withdrawer = Column(String, nullable=False)
-    withdrawal_root = Column(String, nullable=False)
-
-    pod_owner = relationship("Staker")
+BeaconChainETHWithdrawalCompleted = make_event_model(
+    "BeaconChainETHWithdrawalCompleted",
+    "beacon_chain_eth_withdrawal_completed_events",
+    fks={"pod_owner_id": "stakers.id"},
+    extra_cols={
+        "shares": Column(BigInteger, nullable=False),
+        "nonce": Column(Integer, nullable=False),
+        "delegated_address": Column(String, nullable=False),
+        "withdrawer": Column(String, nullable=False),
+        "withdrawal_root": Column(String, nullable=False),
+    },
+    relationships={"pod_owner": relationship("Staker", viewonly=True)},
+)
 
 
 # BeaconChainSlashingEvent Event
 # Purpose: Slashing events on beacon chain for stakers.
 # Relationships: Foreign key to Staker.
-class BeaconChainSlashingEvent(BaseEvent):
-    __tablename__ = "beacon_chain_slashing_events"
-    staker_id = Column(
-        String, ForeignKey("stakers.id", ondelete="CASCADE"), nullable=False
-    )
-    prev_beacon_chain_slashing_factor = Column(BigInteger, nullable=False)
-    new_beacon_chain_slashing_factor = Column(BigInteger, nullable=False)
-
-    staker = relationship("Staker", back_populates="beacon_chain_slashing_events")
+BeaconChainSlashingEvent = make_event_model(
+    "BeaconChainSlashingEvent",
+    "beacon_chain_slashing_events",
+    fks={"staker_id": "stakers.id"},
+    extra_cols={
+        "prev_beacon_chain_slashing_factor": Column(BigInteger, nullable=False),
+        "new_beacon_chain_slashing_factor": Column(BigInteger, nullable=False),
+    },
+    relationships={
+        "staker": relationship("Staker", back_populates="beacon_chain_slashing_events")
+    },
+)
 
 
 # BurnableETHSharesIncreased Event
@@ -789,3 +1164,48 @@ class PectraForkTimestampSet(BaseEvent):
 class ProofTimestampSetterSet(BaseEvent):
     __tablename__ = "proof_timestamp_setter_set_events"
     new_proof_timestamp_setter = Column(String, nullable=False)
+
+
+# Highest-volume tables: analyze after 2% new rows instead of the default 10%,
+# so block-range estimates keep up with ingestion.
+HOT_EVENT_MODELS = (
+    OperatorShareEvent,
+    StakerDelegationEvent,
+    Deposit,
+    WithdrawalEvent,
+    OperatorSharesSlashed,
+    AllocationEvent,
+    EncumberedMagnitudeUpdated,
+    MaxMagnitudeUpdated,
+    DepositScalingFactorUpdated,
+    PodSharesUpdate,
+)
+
+for _model in HOT_EVENT_MODELS:
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(
+            f"ALTER TABLE {_model.__tablename__} "
+            "SET (autovacuum_analyze_scale_factor = 0.02)"
+        ),
+    )
+
+# Tables with covering indexes: vacuum on inserts as well, so the visibility
+# map stays current and index-only scans don't fall back to the heap. They are
+# append-only, so fillfactor stays at the default 100.
+for _model in (
+    OperatorShareEvent,
+    Deposit,
+    OperatorSharesSlashed,
+    AllocationEvent,
+    PodSharesUpdate,
+):
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(
+            f"ALTER TABLE {_model.__tablename__} "
+            "SET (autovacuum_vacuum_insert_scale_factor = 0.02)"
+        ),
+    )
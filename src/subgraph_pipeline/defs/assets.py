@@ -3,8 +3,10 @@ Event extraction and loading assets.
 Combines extraction, transformation, entity upserts, and event loading.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import dagster as dg
+import orjson
 import pandas as pd
 
 from config.allocation_manager import ALLOCATION_MANAGER_EVENT_CONFIGS
@@ -20,195 +22,385 @@ from database.event_loader import EventLoader
 from utils.event_transformers import EventTransformer
 from utils.query_builder import SubgraphQueryBuilder
 from utils.subgraph_client import SubgraphClient
-from utils.debug_print import debug_print
-
-
-def create_event_extraction_and_load_assets(
+from utils.debug_print import PIPELINE_DEBUG, debug_print
+
+# The Graph caps `first` at 1000
+PAGE_SIZE = 1000
+MAX_EVENTS_PER_RUN = 100_000
+
+# Backlogs spanning at least two ranges of this many blocks are fetched
+# concurrently, with up to FETCH_CONCURRENCY requests in flight
+FETCH_CONCURRENCY = 8
+MIN_BLOCKS_PER_RANGE = 50_000
+
+# Events of one group extracted and loaded at the same time
+GROUP_CONCURRENCY = 4
+
+# Entity type (as named in EventConfig.entity_dependencies) -> EntityManager method.
+# Also the upsert order: referenced tables first, and one fixed lock order
+# across concurrent loads.
+UPSERT_DISPATCH = {
+    "Operator": "upsert_operators",
+    "Staker": "upsert_stakers",
+    "AVS": "upsert_avs",
+    "Strategy": "upsert_strategies",
+    "OperatorSet": "upsert_operator_sets",
+    "EigenPod": "upsert_eigen_pods",
+}
+
+
+def _upsert_order(entity_type: str) -> int:
+    """Position of `entity_type` in UPSERT_DISPATCH (unknown types last)."""
+    order = list(UPSERT_DISPATCH)
+    return order.index(entity_type) if entity_type in order else len(order)
+
+
+def _query_events(
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
     config: EventConfig,
-    first: int = 100,
-    order_by: str = "blockNumber",
-    order_direction: str = "asc",
-    upstream_dependency: Optional[Any] = None,
-) -> list[dg.AssetsDefinition]:
-    """
-    Factory function to create event extraction + load assets.
+    **query_kwargs,
+) -> List[Dict[str, Any]]:
+    """Run one page query and return its event rows."""
+    # Page values go as variables: one query text per paging loop
+    query, variables = query_builder.build_parameterized_query(
+        event_name=config["graphql_name"],
+        fields=config["fields"],
+        nested_fields=config.get("nested_fields"),
+        **query_kwargs,
+    )
 
-    This creates multiple assets that:
-    1. Extract events from subgraph
-    2. Transform data (flatten, type conversions)
-    3. Upsert dependent entities (Operator, etc.)
-    4. Load events into database
+    debug_print(query)
+    debug_print(variables)
 
-    Args:
-        config: EventConfig from event_registry
-        first: Number of records to fetch per query
-        order_by: Field to order results by
-        order_direction: 'asc' or 'desc'
+    response = subgraph_client.query(query, variables)
+    return (response.get("data") or {}).get(config["graphql_name"]) or []
 
-    Returns:
-        List of Dagster AssetsDefinition
+
+def fetch_events(
+    context: dg.OpExecutionContext,
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
+    config: EventConfig,
+    first: int = PAGE_SIZE,
+    max_events: int = MAX_EVENTS_PER_RUN,
+    cursor: Optional[Dict[str, Any]] = None,
+    block_number_gte: Optional[int] = None,
+    block_number_lt: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Page through new events in (blockNumber, logIndex) order.
+
+    The Graph sorts on a single field, so pages are ordered by blockNumber and
+    only whole blocks are kept: the trailing block of a full page may be cut
+    off, so it is dropped and re-read as the start of the next page. A block
+    that fills a page on its own is walked with `id_gt` instead. Every
+    returned block is complete, which keeps the (block, logIndex) cursor in
+    the database a valid resume point.
     """
+    events: List[Dict[str, Any]] = []
+    filters: Dict[str, Any] = {"cursor": cursor, "block_number_gte": block_number_gte}
 
-    # Define asset names for dependency resolution
-    extract_asset_name = f"extract_{config['table_name']}"
-    transform_asset_name = f"transform_{config['table_name']}"
-    upsert_asset_name = f"upsert_entities_{config['table_name']}"
-    load_asset_name = f"load_{config['table_name']}"
-
-    # Build the dependency list for the extract asset
-    # This ensures it waits for the previous group to complete
-    extract_deps = {}
-    if upstream_dependency is not None:
-        extract_deps = {"upstream_completion": dg.AssetIn(key=upstream_dependency)}
-
-    @dg.asset(
-        name=extract_asset_name,
-        ins=extract_deps,
-        group_name=config["group_name"],
-    )
-    def _extract_event(
-        context: dg.OpExecutionContext,
-        query_builder: SubgraphQueryBuilder,
-        subgraph_client: SubgraphClient,
-        db_client: DatabaseClient,
-        event_loader: EventLoader,
-        **kwargs,
-    ) -> Dict[str, Any] | None:
-        """
-        Extract {config['graphql_name']} events from subgraph.
-        """
+    while len(events) < max_events:
+        try:
+            page = _query_events(
+                query_builder,
+                subgraph_client,
+                config,
+                first=first,
+                order_by="blockNumber",
+                order_direction="asc",
+                block_number_lt=block_number_lt,
+                **filters,
+            )
+        except Exception as e:
+            context.log.error(f"Subgraph query failed: {e}")
+            raise
 
-        # ========================================
-        # STEP 1: EXTRACT FROM SUBGRAPH
-        # ========================================
-        context.log.info(f"Extracting {config['graphql_name']} from subgraph...")
+        if len(page) < first:
+            events.extend(page)
+            break
 
-        # Check for last processed block for incremental loading
-        with db_client.get_session() as session:
-            # Get last cursor from DB (blockNumber + logIndex)
-            last_cursor = event_loader.get_last_cursor(session, config["table_name"])
-
-        # Default values
-        cursor = None
-        block_number_gte = None
-
-        # Prefer cursor-based pagination if available
-        if last_cursor:
-            block_number, log_index = last_cursor
-            cursor = {
-                "blockNumber": block_number,
-                "logIndex": log_index or 0,  # fallback to 0 if missing
-            }
-            context.log.info(
-                f"Incremental load using cursor: block {cursor['blockNumber']}, logIndex {cursor['logIndex']}"
-            )
+        last_block = int(page[-1]["blockNumber"])
+        complete = [event for event in page if int(event["blockNumber"]) < last_block]
+
+        if complete:
+            events.extend(complete)
+            filters = {"block_number_gte": last_block}
         else:
-            # Fallback: start from next block after last processed
-            with db_client.get_session() as session:
-                last_block = event_loader.get_last_processed_block(
-                    session, config["table_name"]
-                )
-            if last_block is not None:
-                block_number_gte = last_block + 1
-                context.log.info(
-                    f"Incremental load: starting from block {block_number_gte}"
-                )
-            else:
-                context.log.info(
-                    "No previous cursor or block found — full load will run."
+            events.extend(
+                _fetch_block_events(
+                    query_builder, subgraph_client, config, last_block, first
                 )
+            )
+            filters = {"block_number_gte": last_block + 1}
 
-        # ✅ Build query dynamically
-        query = query_builder.build_query(
-            event_name=config["graphql_name"],
-            fields=config["fields"],
+        context.log.info(
+            f"Fetched {len(events)} {config['graphql_name']} so far "
+            f"(through block {last_block - 1 if complete else last_block})"
+        )
+
+    return events
+
+
+def fetch_events_concurrently(
+    context: dg.OpExecutionContext,
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
+    config: EventConfig,
+    first: int = PAGE_SIZE,
+    max_events: int = MAX_EVENTS_PER_RUN,
+    cursor: Optional[Dict[str, Any]] = None,
+    block_number_gte: Optional[int] = None,
+    concurrency: int = FETCH_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Like `fetch_events`, but splits a long backlog into disjoint block ranges:
+    their first pages come back from one aliased query, and ranges with more
+    pending are paged on a thread pool, so request round-trips overlap.
+
+    Ranges are stitched back in block order and cut after the first range that
+    reached `max_events`, so the result is still a gap-free prefix of the
+    backlog. The first range restarts at the cursor block; rows already loaded
+    from it are skipped on insert.
+    """
+    start_block = cursor["blockNumber"] if cursor else (block_number_gte or 0)
+
+    # Probe the newest pending block to size the ranges
+    latest = _query_events(
+        query_builder,
+        subgraph_client,
+        config,
+        first=1,
+        order_by="blockNumber",
+        order_direction="desc",
+        block_number_gte=start_block,
+    )
+    if not latest:
+        return []
+
+    end_block = int(latest[0]["blockNumber"]) + 1
+    span = end_block - start_block
+    range_count = min(concurrency, span // MIN_BLOCKS_PER_RANGE)
+
+    if range_count <= 1:
+        return fetch_events(
+            context,
+            query_builder,
+            subgraph_client,
+            config,
             first=first,
-            order_by=order_by,
-            order_direction=order_direction,
-            nested_fields=config.get("nested_fields"),
-            cursor=cursor if cursor else None,
-            block_number_gte=(
-                None
-                if cursor
-                else (block_number_gte if last_block is not None else None)
-            ),
+            max_events=max_events,
+            cursor=cursor,
+            block_number_gte=block_number_gte,
         )
 
-        debug_print(query)
+    step = -(-span // range_count)
+    bounds = [
+        (low, min(low + step, end_block)) for low in range(start_block, end_block, step)
+    ]
+    context.log.info(
+        f"Fetching {config['graphql_name']} blocks {start_block}-{end_block - 1} "
+        f"in {len(bounds)} concurrent ranges"
+    )
 
-        try:
-            response = subgraph_client.query(query)
-        except Exception as e:
-            context.log.error(f"Subgraph query failed: {e}")
-            raise
+    # First page of every range in one aliased request; only ranges that
+    # filled it keep paging
+    first_pages = _query_range_pages(
+        query_builder, subgraph_client, config, bounds, first
+    )
 
-        # Extract event data
-        data = response.get("data", {}).get(config["graphql_name"], [])
-        if not data:
-            context.log.warning(f"No new {config['graphql_name']} found.")
-            return None
+    events: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+        futures = [
+            pool.submit(
+                _continue_range,
+                context,
+                query_builder,
+                subgraph_client,
+                config,
+                page,
+                first,
+                max_events,
+                low,
+                high,
+            )
+            for page, (low, high) in zip(first_pages, bounds)
+        ]
+        for future in futures:
+            events.extend(future.result())
+            if len(events) >= max_events:
+                # Later ranges would leave a gap behind the cursor
+                pool.shutdown(cancel_futures=True)
+                break
 
-        df = pd.DataFrame(data)
-        context.log.info(f"Fetched {len(df)} {config['graphql_name']} events.")
-        debug_print(df.head())
+    return events
 
-        return {"df": df, "data": data}
 
-    @dg.asset(
-        name=transform_asset_name,
-        group_name=config["group_name"],
-        ins={
-            "extract_output": dg.AssetIn(key=extract_asset_name),
-        },
+def _query_range_pages(
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
+    config: EventConfig,
+    bounds: List[Tuple[int, int]],
+    first: int,
+) -> List[List[Dict[str, Any]]]:
+    """Fetch the first page of each block range with one aliased query."""
+    query = query_builder.build_batched_query(
+        event_name=config["graphql_name"],
+        fields=config["fields"],
+        block_ranges=[{"gte": low, "lt": high} for low, high in bounds],
+        first=first,
+        nested_fields=config.get("nested_fields"),
+        order_by="blockNumber",
+        order_direction="asc",
     )
-    def _transform_event(
-        context: dg.OpExecutionContext,
-        extract_output: Dict[str, Any] | None,
-        transformer: EventTransformer,
-    ) -> pd.DataFrame | None:
-        """
-        Transform extracted {config['graphql_name']} event data.
-        """
 
-        if extract_output is None:
-            return None
+    debug_print(query)
 
-        # ========================================
-        # STEP 2: TRANSFORM DATA
-        # ========================================
-        context.log.info("Transforming event data...")
+    data = subgraph_client.query(query).get("data") or {}
+    return [data.get(f"r{i}") or [] for i in range(len(bounds))]
 
-        df = extract_output["df"]
-        data = extract_output["data"]
 
-        df_transformed = transformer.transform_event_data(
-            df=df,
-            config=config,
-            original_data=data,  # Keep original for raw_data column
+def _continue_range(
+    context: dg.OpExecutionContext,
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
+    config: EventConfig,
+    page: List[Dict[str, Any]],
+    first: int,
+    max_events: int,
+    block_number_gte: int,
+    block_number_lt: int,
+) -> List[Dict[str, Any]]:
+    """Complete one block range from its already fetched first page."""
+    if len(page) < first:
+        return page
+
+    # Keep whole blocks, the trailing one is re-read by the next page
+    last_block = int(page[-1]["blockNumber"])
+    complete = [event for event in page if int(event["blockNumber"]) < last_block]
+    if complete:
+        block_number_gte = last_block
+
+    return complete + fetch_events(
+        context,
+        query_builder,
+        subgraph_client,
+        config,
+        first=first,
+        max_events=max_events - len(complete),
+        block_number_gte=block_number_gte,
+        block_number_lt=block_number_lt,
+    )
+
+
+def _fetch_block_events(
+    query_builder: SubgraphQueryBuilder,
+    subgraph_client: SubgraphClient,
+    config: EventConfig,
+    block_number: int,
+    first: int,
+) -> List[Dict[str, Any]]:
+    """Fetch every event of a single block, paging by id."""
+    events: List[Dict[str, Any]] = []
+    last_id = None
+
+    while True:
+        page = _query_events(
+            query_builder,
+            subgraph_client,
+            config,
+            first=first,
+            order_by="id",
+            order_direction="asc",
+            last_id=last_id,
+            extra_filters={"blockNumber": block_number},
         )
+        events.extend(page)
 
-        return df_transformed
+        if len(page) < first:
+            return events
+        last_id = page[-1]["id"]
 
-    @dg.asset(
-        name=upsert_asset_name,
-        group_name=config["group_name"],
-        ins={
-            "transform_output": dg.AssetIn(key=transform_asset_name),
-        },
-    )
-    def _upsert_entities(
-        context: dg.OpExecutionContext,
-        transform_output: pd.DataFrame | None,
-        db_client: DatabaseClient,
-        entity_manager: EntityManager,
-    ) -> Dict[str, Any]:
-        """
-        Upsert entities for {config['graphql_name']} events.
-        """
 
-        if transform_output is None:
-            return {}
+def _resume_point(cursor: Tuple[Optional[int], Optional[int]]) -> Dict[str, Any]:
+    """
+    Query filters resuming after the last loaded (blockNumber, logIndex);
+    empty for a full load.
+    """
+    block_number, log_index = cursor
+    if block_number is None:
+        return {}
+    return {"cursor": {"blockNumber": block_number, "logIndex": log_index or 0}}
 
+
+def _output_metadata(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Dagster UI metadata for one event's load result.
+    Entities are summarized as inserted counts; full upsert stats are only
+    recorded with PIPELINE_DEBUG set.
+    """
+    entity_stats = result["entities_upserted"]
+    if not PIPELINE_DEBUG:
+        entity_stats = {
+            entity_type: stats.get("inserted", 0)
+            for entity_type, stats in entity_stats.items()
+        }
+
+    return {
+        "events_fetched": dg.MetadataValue.int(result["events_fetched"]),
+        "events_inserted": dg.MetadataValue.int(result["events_inserted"]),
+        "last_block": dg.MetadataValue.int(
+            int(result.get("last_block_processed") or 0)
+        ),
+        "entities": dg.MetadataValue.json(entity_stats),
+    }
+
+
+def _load_event_data(
+    context: dg.OpExecutionContext,
+    config: EventConfig,
+    data: List[Dict[str, Any]],
+    last_block: Optional[int],
+    transformer: EventTransformer,
+    db_client: DatabaseClient,
+    entity_manager: EntityManager,
+    event_loader: EventLoader,
+) -> Dict[str, Any]:
+    """
+    Transform fetched {config['graphql_name']} rows, upsert their entities and
+    load them into {config['table_name']}.
+    """
+    if not data:
+        context.log.warning(f"No new {config['graphql_name']} found.")
+        context.log.info(f"No new data to load into {config['table_name']}.")
+
+        return {
+            "status": "no_new_data",
+            "events_fetched": 0,
+            "events_inserted": 0,
+            "events_updated": 0,
+            "events_skipped": 0,
+            "events_errors": 0,
+            "entities_upserted": {},
+            "last_block_processed": last_block,
+        }
+
+    df = pd.DataFrame(data)
+    # Serialize the raw payloads now, so `data` needn't travel with the frame
+    df["raw_data"] = [orjson.dumps(row).decode() for row in data]
+    context.log.info(f"Fetched {len(df)} {config['graphql_name']} events.")
+    debug_print(df.head())
+
+    # ========================================
+    # STEP 2: TRANSFORM DATA
+    # ========================================
+    context.log.info("Transforming event data...")
+
+    df_transformed = transformer.transform_event_data(df=df, config=config)
+
+    # Entities and events commit together
+    with db_client.get_session() as session:
         # ========================================
         # STEP 3: UPSERT ENTITIES
         # ========================================
@@ -216,205 +408,228 @@ def create_event_extraction_and_load_assets(
 
         entity_stats = {}
 
-        with db_client.get_session() as session:
-            for entity_type in config["entity_dependencies"]:
-                # Extract entity IDs using configured extractor
-                extractor = config["entity_extractors"].get(entity_type)
-                if not extractor:
-                    context.log.warning(
-                        f"No extractor defined for entity type: {entity_type}"
-                    )
-                    continue
-
-                try:
-                    entity_ids = extractor(transform_output)
-
-                    # Call appropriate upsert method
-                    if entity_type == "Operator":
-                        stats = entity_manager.upsert_operators(
-                            session, entity_ids, context
-                        )
-                    elif entity_type == "Staker":
-                        stats = entity_manager.upsert_stakers(
-                            session, entity_ids, context
-                        )
-                    elif entity_type == "AVS":
-                        stats = entity_manager.upsert_avs(session, entity_ids, context)
-                    elif entity_type == "Strategy":
-                        stats = entity_manager.upsert_strategies(
-                            session, entity_ids, context
-                        )
-                    elif entity_type == "OperatorSet":
-                        # Extract operator set data (returns List[Dict])
-                        operator_set_data = extractor(transform_output)
-                        stats = entity_manager.upsert_operator_sets(
-                            session, operator_set_data, context
-                        )
-                    elif entity_type == "EigenPod":
-                        # Extract eigen pod data (returns List[Dict])
-                        pod_data = extractor(transform_output)
-                        stats = entity_manager.upsert_eigen_pods(
-                            session, pod_data, context
-                        )
-                    else:
-                        context.log.warning(f"Unknown entity type: {entity_type}")
-                        stats = {"inserted": 0, "updated": 0, "skipped": 0}
-
-                    entity_stats[entity_type] = stats
-
-                except Exception as e:
-                    context.log.error(f"Failed to upsert {entity_type}: {e}")
-                    entity_stats[entity_type] = {"error": str(e)}
-
-        return entity_stats
-
-    @dg.asset(
-        name=load_asset_name,
-        group_name=config["group_name"],
-        metadata={
-            "event_type": config["graphql_name"],
-            "table": config["table_name"],
-            "contract": config["contract_source"],
-            "entities": config["entity_dependencies"],
-        },
-        ins={
-            "transform_output": dg.AssetIn(key=transform_asset_name),
-            "upsert_output": dg.AssetIn(key=upsert_asset_name),
+        for entity_type in sorted(config["entity_dependencies"], key=_upsert_order):
+            # Extract entity IDs using configured extractor
+            extractor = config["entity_extractors"].get(entity_type)
+            if not extractor:
+                context.log.warning(
+                    f"No extractor defined for entity type: {entity_type}"
+                )
+                continue
+
+            try:
+                entity_ids = extractor(df_transformed)
+
+                # OperatorSet / EigenPod extractors return List[Dict]
+                upsert_name = UPSERT_DISPATCH.get(entity_type)
+                if upsert_name:
+                    upsert = getattr(entity_manager, upsert_name)
+                    # Savepoint: a failed upsert rolls back only itself, not
+                    # the shared transaction the events load into
+                    with session.begin_nested():
+                        stats = upsert(session, entity_ids, context)
+                else:
+                    context.log.warning(f"Unknown entity type: {entity_type}")
+                    stats = {"inserted": 0, "updated": 0, "skipped": 0}
+
+                entity_stats[entity_type] = stats
+
+            except Exception as e:
+                context.log.error(f"Failed to upsert {entity_type}: {e}")
+                entity_stats[entity_type] = {"error": str(e)}
+
+        # ========================================
+        # STEP 4: LOAD EVENTS
+        # ========================================
+        context.log.info(f"Loading events into {config['table_name']}...")
+
+        try:
+            load_stats = event_loader.load_events(
+                session=session,
+                df=df_transformed,
+                table_name=config["table_name"],
+                context=context,
+            )
+        except Exception as e:
+            context.log.error(f"Failed to load events: {e}")
+            raise
+
+    # ========================================
+    # STEP 5: RETURN METADATA
+    # ========================================
+    result = {
+        "status": "success",
+        "events_fetched": len(df_transformed),
+        "events_inserted": load_stats["inserted"],
+        "events_updated": load_stats["updated"],
+        "events_skipped": load_stats["skipped"],
+        "events_errors": load_stats["errors"],
+        "entities_upserted": entity_stats,
+        # int64 after transform: a plain ndarray max, returned as a Python int
+        "last_block_processed": int(df_transformed["block_number"].to_numpy().max()),
+    }
+
+    context.log.info(f"Event {config['graphql_name']} completed: {result}")
+
+    return result
+
+
+def create_event_group_asset(
+    event_configs: Dict[str, EventConfig],
+    first: int = PAGE_SIZE,
+    max_events: int = MAX_EVENTS_PER_RUN,
+) -> dg.AssetsDefinition:
+    """
+    Factory function to create the extraction + load asset of an event group.
+
+    One GraphQL document requests the first page of every event in the group;
+    events with more pages pending keep paging on their own. Up to
+    GROUP_CONCURRENCY events are then processed at once, each in its own
+    thread and transaction:
+    1. Extract events from subgraph
+    2. Transform data (flatten, type conversions)
+    3. Upsert dependent entities (Operator, etc.)
+    4. Load events into database
+
+    Each event is materialized as its own `load_<table>` asset.
+
+    Args:
+        event_configs: Mapping event_name -> EventConfig for one group
+        first: Number of records to fetch per query (page size)
+        max_events: Stop paging an event once this many are fetched; the
+            next run resumes from the last loaded block
+
+    Returns:
+        Dagster AssetsDefinition (multi-asset)
+    """
+    configs = list(event_configs.values())
+    group_name = configs[0]["group_name"]
+
+    @dg.multi_asset(
+        name=f"extract_and_load_{group_name}",
+        group_name=group_name,
+        # One pool per group: groups run side by side, while two runs of the
+        # same group (e.g. a manual backfill over a tick) queue, since they
+        # would resume from the same cursors
+        pool=group_name,
+        outs={
+            f"load_{config['table_name']}": dg.AssetOut(
+                metadata={
+                    "event_type": config["graphql_name"],
+                    "table": config["table_name"],
+                    "contract": config["contract_source"],
+                    "entities": config["entity_dependencies"],
+                },
+            )
+            for config in configs
         },
     )
-    def _load_event(
+    def _extract_and_load_group(
         context: dg.OpExecutionContext,
-        transform_output: pd.DataFrame | None,
-        upsert_output: Dict[str, Any],
+        query_builder: SubgraphQueryBuilder,
+        subgraph_client: SubgraphClient,
+        transformer: EventTransformer,
         db_client: DatabaseClient,
+        entity_manager: EntityManager,
         event_loader: EventLoader,
-    ) -> Dict[str, Any]:
+    ):
         """
-        Load transformed {config['graphql_name']} events into {config['table_name']}.
+        Extract and load every {group_name} event.
         """
 
-        if transform_output is None:
-            context.log.info(f"No new data to load into {config['table_name']}.")
-
-            with db_client.get_session() as session:
-                last_block = event_loader.get_last_processed_block(
-                    session, config["table_name"]
-                )
+        # ========================================
+        # STEP 1: EXTRACT FROM SUBGRAPH
+        # ========================================
+        context.log.info(f"Extracting {len(configs)} {group_name} events...")
 
-            result = {
-                "status": "no_new_data",
-                "events_fetched": 0,
-                "events_inserted": 0,
-                "events_updated": 0,
-                "events_skipped": 0,
-                "events_errors": 0,
-                "entities_upserted": {},
-                "last_block_processed": last_block,
-            }
-
-            context.add_output_metadata(
-                {
-                    "events_fetched": dg.MetadataValue.int(result["events_fetched"]),
-                    "events_inserted": dg.MetadataValue.int(result["events_inserted"]),
-                    "last_block": dg.MetadataValue.int(
-                        int(result.get("last_block_processed") or 0)
-                    ),
-                    "entities": dg.MetadataValue.json(result["entities_upserted"]),
-                }
+        # One query for the whole group's cursors
+        with db_client.get_session() as session:
+            cursors = event_loader.get_last_cursors(
+                session, [config["table_name"] for config in configs]
             )
+        resume = {
+            config["graphql_name"]: _resume_point(cursors[config["table_name"]])
+            for config in configs
+        }
 
-            return result
+        query = query_builder.build_combined_query(configs, resume, first=first)
 
-        df_transformed = transform_output
-        entity_stats = upsert_output
+        debug_print(query)
 
-        # ========================================
-        # STEP 4: LOAD EVENTS
-        # ========================================
-        context.log.info(f"Loading events into {config['table_name']}...")
+        try:
+            response = subgraph_client.query(query)
+        except Exception as e:
+            context.log.error(f"Subgraph query failed: {e}")
+            raise
 
-        with db_client.get_session() as session:
-            try:
-                load_stats = event_loader.load_events(
-                    session=session,
-                    df=df_transformed,
-                    table_name=config["table_name"],
-                    context=context,
+        response_data = response.get("data") or {}
+
+        def _extract_and_load(config: EventConfig) -> Dict[str, Any]:
+            event_name = config["graphql_name"]
+            data = response_data.get(event_name) or []
+
+            if len(data) >= first:
+                # More pending: keep whole blocks, page the rest separately
+                last_block = int(data[-1]["blockNumber"])
+                data = [
+                    event for event in data if int(event["blockNumber"]) < last_block
+                ]
+                data += fetch_events_concurrently(
+                    context,
+                    query_builder,
+                    subgraph_client,
+                    config,
+                    first=first,
+                    max_events=max_events - len(data),
+                    block_number_gte=last_block,
                 )
-            except Exception as e:
-                context.log.error(f"Failed to load events: {e}")
-                raise
 
-        # ========================================
-        # STEP 5: RETURN METADATA
-        # ========================================
-        result = {
-            "status": "success",
-            "events_fetched": len(df_transformed),
-            "events_inserted": load_stats["inserted"],
-            "events_updated": load_stats["updated"],
-            "events_skipped": load_stats["skipped"],
-            "events_errors": load_stats["errors"],
-            "entities_upserted": entity_stats,
-            "last_block_processed": df_transformed["block_number"].max(),
-        }
+            return _load_event_data(
+                context,
+                config,
+                data,
+                resume[event_name].get("cursor", {}).get("blockNumber"),
+                transformer,
+                db_client,
+                entity_manager,
+                event_loader,
+            )
 
-        context.log.info(f"Asset completed successfully: {result}")
-
-        # Log to Dagster metadata for visibility in UI
-        context.add_output_metadata(
-            {
-                "events_fetched": dg.MetadataValue.int(result["events_fetched"]),
-                "events_inserted": dg.MetadataValue.int(result["events_inserted"]),
-                "last_block": dg.MetadataValue.int(
-                    int(result.get("last_block_processed") or 0)
-                ),
-                "entities": dg.MetadataValue.json(result["entities_upserted"]),
-            }
-        )
+        # Events load in parallel (each in its own session); outputs are
+        # still yielded in config order
+        with ThreadPoolExecutor(max_workers=GROUP_CONCURRENCY) as pool:
+            futures = [pool.submit(_extract_and_load, config) for config in configs]
 
-        return result
+        for config, future in zip(configs, futures):
+            result = future.result()
 
-    return [_extract_event, _transform_event, _upsert_entities, _load_event]
+            yield dg.Output(
+                result,
+                output_name=f"load_{config['table_name']}",
+                metadata=_output_metadata(result),
+            )
+
+    return _extract_and_load_group
 
 
 # Generate selected assets programmatically
 def generate_event_assets(selected_event_configs: Dict[str, Dict[str, Any]]):
     """
-    Generate event assets from a provided subset of event configs.
+    Generate the group asset for a provided subset of event configs.
 
     Args:
         selected_event_configs: Dictionary mapping event_name -> config to generate assets for.
 
     Returns:
-        List of generated asset names.
+        List with the generated group asset.
     """
-    assets = []
-    previous_group_final_asset = None
-
-    for i, (event_name, config) in enumerate(selected_event_configs.items()):
-        # Create assets for this event group
-        event_assets = create_event_extraction_and_load_assets(
-            config=config,
-            first=1,
-            upstream_dependency=previous_group_final_asset,
-        )
-
-        assets.extend(event_assets)
-
-        # The last asset (_load_event) becomes the dependency for the next group
-        previous_group_final_asset = f"load_{config['table_name']}"
-
-        # Optional logging
-        if i == 0:
-            print(f"Starting chain with {event_name}")
-        else:
-            print(f"Chaining {event_name} after previous group")
+    group_asset = create_event_group_asset(selected_event_configs)
 
     print(
-        f"Generated {len(assets)} assets across {len(selected_event_configs)} event groups"
+        f"Generated {len(group_asset.keys)} event assets in group "
+        f"{next(iter(selected_event_configs.values()))['group_name']}"
     )
-    return assets
+    return [group_asset]
 
 
 # -----------------------------
@@ -1,5 +1,8 @@
+import os
+
 import dagster as dg
 
+from config.event_config import list_all_events
 from database.database_client import DatabaseClient
 from database.entity_manager import EntityManager
 from database.event_loader import EventLoader
@@ -8,6 +11,7 @@ from utils.query_builder import SubgraphQueryBuilder
 from utils.subgraph_client import SubgraphClient
 
 from subgraph_pipeline.defs.assets import (
+    GROUP_CONCURRENCY,
     delegation_manager_event_assets,
     allocation_manager_event_assets,
     avs_directory_event_assets,
@@ -21,84 +25,104 @@ from subgraph_pipeline.defs.assets import (
 # -----------------------------
 delegation_manager_job = dg.define_asset_job(
     name="delegation_manager_events",
-    selection=[asset.key for asset in delegation_manager_event_assets],
-    description="Process all delegation manager events sequentially",
+    selection=dg.AssetSelection.assets(*delegation_manager_event_assets),
+    description=(
+        "Process all delegation manager events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 allocation_manager_job = dg.define_asset_job(
     name="allocation_manager_events",
-    selection=[asset.key for asset in allocation_manager_event_assets],
-    description="Process all allocation manager events sequentially",
+    selection=dg.AssetSelection.assets(*allocation_manager_event_assets),
+    description=(
+        "Process all allocation manager events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 avs_directory_job = dg.define_asset_job(
     name="avs_directory_events",
-    selection=[asset.key for asset in avs_directory_event_assets],
-    description="Process all AVS directory events sequentially",
+    selection=dg.AssetSelection.assets(*avs_directory_event_assets),
+    description=(
+        "Process all AVS directory events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 eigenpod_manager_job = dg.define_asset_job(
     name="eigenpod_manager_events",
-    selection=[asset.key for asset in eigenpod_manager_event_assets],
-    description="Process all EigenPod manager events sequentially",
+    selection=dg.AssetSelection.assets(*eigenpod_manager_event_assets),
+    description=(
+        "Process all EigenPod manager events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 rewards_coordinator_job = dg.define_asset_job(
     name="rewards_coordinator_events",
-    selection=[asset.key for asset in rewards_coordinator_event_assets],
-    description="Process all rewards coordinator events sequentially",
+    selection=dg.AssetSelection.assets(*rewards_coordinator_event_assets),
+    description=(
+        "Process all rewards coordinator events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 strategy_manager_job = dg.define_asset_job(
     name="strategy_manager_events",
-    selection=[asset.key for asset in strategy_manager_event_assets],
-    description="Process all strategy manager events sequentially",
+    selection=dg.AssetSelection.assets(*strategy_manager_event_assets),
+    description=(
+        "Process all strategy manager events (one multi-asset, "
+        f"up to {GROUP_CONCURRENCY} events in parallel)"
+    ),
 )
 
 # -----------------------------
 # Define schedules for each job
 # -----------------------------
 
-# 3 hours total = 180 minutes, 6 jobs → stagger ~30 minutes apart
+# 3 hours total = 180 minutes, 6 jobs → stagger ~30 minutes apart.
+# Each job has its own minute (7, 37, 17, 47, 27, 57), off the hour and
+# half-hour marks that other clock-aligned jobs (and subgraph syncs) use.
 
 delegation_manager_schedule = dg.ScheduleDefinition(
     job=delegation_manager_job,
-    cron_schedule="0 0,6,12,18 * * *",  # start at 00:00, 06:00, 12:00, 18:00
+    cron_schedule="7 0,6,12,18 * * *",  # start at 00:07, 06:07, 12:07, 18:07
     name="delegation_manager_4x_daily",
     description="Run delegation manager events 4 times daily at 6-hour intervals",
 )
 
 allocation_manager_schedule = dg.ScheduleDefinition(
     job=allocation_manager_job,
-    cron_schedule="30 0,6,12,18 * * *",  # start at 00:30, 06:30, 12:30, 18:30
+    cron_schedule="37 0,6,12,18 * * *",  # start at 00:37, 06:37, 12:37, 18:37
     name="allocation_manager_4x_daily",
     description="Run allocation manager events 4 times daily at 6-hour intervals",
 )
 
 avs_directory_schedule = dg.ScheduleDefinition(
     job=avs_directory_job,
-    cron_schedule="0 1,7,13,19 * * *",  # start at 01:00, 07:00, 13:00, 19:00
+    cron_schedule="17 1,7,13,19 * * *",  # start at 01:17, 07:17, 13:17, 19:17
     name="avs_directory_4x_daily",
     description="Run AVS directory events 4 times daily at 6-hour intervals",
 )
 
 eigenpod_manager_schedule = dg.ScheduleDefinition(
     job=eigenpod_manager_job,
-    cron_schedule="30 1,7,13,19 * * *",  # start at 01:30, 07:30, 13:30, 19:30
+    cron_schedule="47 1,7,13,19 * * *",  # start at 01:47, 07:47, 13:47, 19:47
     name="eigenpod_manager_4x_daily",
     description="Run EigenPod manager events 4 times daily at 6-hour intervals",
 )
 
 rewards_coordinator_schedule = dg.ScheduleDefinition(
     job=rewards_coordinator_job,
-    cron_schedule="0 2,8,14,20 * * *",  # start at 02:00, 08:00, 14:00, 20:00
+    cron_schedule="27 2,8,14,20 * * *",  # start at 02:27, 08:27, 14:27, 20:27
     name="rewards_coordinator_4x_daily",
     description="Run rewards coordinator events 4 times daily at 6-hour intervals",
 )
 
 strategy_manager_schedule = dg.ScheduleDefinition(
     job=strategy_manager_job,
-    cron_schedule="30 2,8,14,20 * * *",  # start at 02:30, 08:30, 14:30, 20:30
+    cron_schedule="57 2,8,14,20 * * *",  # start at 02:57, 08:57, 14:57, 20:57
     name="strategy_manager_4x_daily",
     description="Run strategy manager events 4 times daily at 6-hour intervals",
 )
@@ -107,12 +131,27 @@ strategy_manager_schedule = dg.ScheduleDefinition(
 # -----------------------------
 # Define resources and definitions
 # -----------------------------
+# DatabaseClient field -> env var; unset vars keep the ENGINE_KW defaults
+DB_POOL_ENV_VARS = {
+    "pool_size": "DB_POOL_SIZE",
+    "max_overflow": "DB_POOL_MAX_OVERFLOW",
+}
+
+
+def _db_pool_overrides():
+    return {
+        field: dg.EnvVar.int(env_var)
+        for field, env_var in DB_POOL_ENV_VARS.items()
+        if os.getenv(env_var)
+    }
+
+
 @dg.definitions
 def resources():
     return dg.Definitions(
         resources={
             # Query builder for dynamic subgraph GraphQL queries
-            "query_builder": SubgraphQueryBuilder(),
+            "query_builder": SubgraphQueryBuilder(allowed_events=list_all_events()),
             # Subgraph client for interacting with the GraphQL endpoint
             "subgraph_client": SubgraphClient(
                 endpoint=dg.EnvVar("SUBGRAPH_ENDPOINT"),
@@ -121,8 +160,7 @@ def resources():
             # Database client for Postgres
             "db_client": DatabaseClient(
                 connection_string=dg.EnvVar("POSTGRES_CONNECTION_STRING"),
-                pool_size=5,
-                max_overflow=10,
+                **_db_pool_overrides(),
             ),
             # Entity manager to handle DB entity operations
             "entity_manager": EntityManager(),
@@ -1,20 +1,46 @@
+import os
+
+import orjson
 import pandas as pd
-import json
+
+# Debug output is off unless PIPELINE_DEBUG is set (read once, at import)
+PIPELINE_DEBUG = bool(os.environ.get("PIPELINE_DEBUG"))
+
+# Rows / items dumped at most per call
+DEBUG_MAX_ROWS = 20
+
+
+def _dumps(data) -> str:
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
 
 
 def debug_print(data):
-    """Pretty-print any data (including DataFrames) in full JSON format with clear separators."""
+    """
+    Pretty-print any data (including DataFrames) in JSON format with clear
+    separators. Frames and lists are cut to their first DEBUG_MAX_ROWS items.
+    """
+    if not PIPELINE_DEBUG:
+        return
+
     separator_top = ">>>" * 40
     separator_bottom = "<<<" * 40
     print(separator_top)
 
-    # Convert DataFrame to JSON
+    # Convert DataFrame to JSON (only the rows that get printed)
     if isinstance(data, pd.DataFrame):
-        json_data = data.to_dict(orient="records")
-        print(json.dumps(json_data, indent=2, default=str))
+        json_data = data.head(DEBUG_MAX_ROWS).to_dict(orient="records")
+        print(_dumps(json_data))
     # Convert lists or dicts directly
     elif isinstance(data, (dict, list)):
-        print(json.dumps(data, indent=2, default=str))
+        if isinstance(data, list):
+            data = data[:DEBUG_MAX_ROWS]
+        print(_dumps(data))
     else:
         # Fallback to string representation
         print(str(data))
@@ -4,11 +4,26 @@ Handles flattening, type conversions, and preparing data for DB insertion.
 """
 
 from typing import Dict, List, Optional
-from datetime import datetime, timezone
+import time
 
 import dagster as dg
+import numpy as np
 import pandas as pd
 
+# Event position columns shared by every event table (all fit in int64)
+NUMERIC_COLUMNS = ["block_number", "log_index", "block_timestamp"]
+
+
+def entity_ids(values: pd.Series) -> List[str]:
+    """
+    Unique non-null ids from a column holding ids or nested {"id": ...}
+    objects. Only the dict cells go through Python; dedup is pd.unique.
+    """
+    is_dict = values.map(type).eq(dict)
+    if is_dict.any():
+        values = values.where(~is_dict, values[is_dict].map(lambda x: x.get("id")))
+    return pd.unique(values.dropna().to_numpy()).tolist()
+
 
 class EventTransformer(dg.ConfigurableResource):
     """
@@ -36,24 +51,38 @@ class EventTransformer(dg.ConfigurableResource):
         if not nested_config or df.empty:
             return df
 
-        df = df.copy()
+        expanded = []
 
         for parent_field, sub_fields in nested_config.items():
             if parent_field not in df.columns:
                 continue
 
-            # Extract nested fields
-            for sub_field in sub_fields:
-                new_col_name = f"{parent_field}_{sub_field}"
-
-                df[new_col_name] = df[parent_field].apply(
-                    lambda x: x.get(sub_field) if isinstance(x, dict) else None
-                )
+            # One isinstance pass per parent; only the dict rows get expanded
+            # (a parent column is almost always all-dict or all-null)
+            values = df[parent_field].to_numpy()
+            is_dict = np.fromiter(
+                (isinstance(v, dict) for v in values), dtype=bool, count=len(values)
+            )
+            nested = pd.DataFrame.from_records(
+                values[is_dict].tolist(),
+                index=df.index[is_dict],
+                columns=sub_fields,
+            )
+            if not is_dict.all():
+                nested = nested.reindex(df.index)
+            expanded.append(nested.add_prefix(f"{parent_field}_"))
 
             # Keep the parent field for raw_data, but we can also drop it
             # For now, we'll keep it
 
-        return df
+        if not expanded:
+            return df
+
+        # One concat instead of a column insert per sub-field
+        flattened = pd.concat(expanded, axis=1)
+        return pd.concat(
+            [df.drop(columns=flattened.columns, errors="ignore"), flattened], axis=1
+        )
 
     def prepare_raw_data(
         self, df: pd.DataFrame, original_data: Optional[List[Dict]] = None
@@ -66,45 +95,66 @@ class EventTransformer(dg.ConfigurableResource):
             original_data: Original list of dicts from subgraph response
 
         Returns:
-            DataFrame with raw_data column added
+            DataFrame with raw_data column added (`df` itself, modified)
         """
-        if df.empty:
+        if df.empty or "raw_data" in df.columns:
+            # Already serialized during extract
             return df
 
-        df = df.copy()
-
         if original_data:
             # Use original data if provided
             df["raw_data"] = original_data
         else:
-            # Convert current row to JSON (excluding binary columns)
-            df["raw_data"] = df.apply(
-                lambda row: {
-                    k: v for k, v in row.to_dict().items() if not isinstance(v, bytes)
-                },
-                axis=1,
-            )
+            # Convert current row to JSON (excluding binary columns);
+            # to_dict builds all records at once, no Series per row
+            binary_columns = [
+                column
+                for column in df.columns
+                if df[column].dtype == object
+                and df[column].map(lambda v: isinstance(v, bytes)).any()
+            ]
+            df["raw_data"] = df.drop(columns=binary_columns).to_dict(orient="records")
+
+        return df
+
+    def cast_numeric_columns(
+        self, df: pd.DataFrame, columns: List[str] = NUMERIC_COLUMNS
+    ) -> pd.DataFrame:
+        """
+        Convert subgraph BigInt strings to int64 for the given columns.
+
+        Args:
+            df: DataFrame (after renaming)
+            columns: Columns to convert, when present
+
+        Returns:
+            DataFrame with numeric columns (`df` itself, modified)
+        """
+        if df.empty:
+            return df
+
+        for column in columns:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column])
 
         return df
 
     def add_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Add created_at and updated_at timestamp columns.
+        Add the created_at column (unix seconds).
+        Events are immutable, so there is no updated_at.
 
         Args:
             df: DataFrame
 
         Returns:
-            DataFrame with timestamp columns
+            DataFrame with created_at column (`df` itself, modified)
         """
         if df.empty:
             return df
 
-        df = df.copy()
-        now = datetime.now(timezone.utc)
-
-        df["created_at"] = now
-        df["updated_at"] = now
+        # One int64 scalar broadcast: a contiguous int64 column, never objects
+        df["created_at"] = np.int64(time.time())
 
         return df
 
@@ -123,12 +173,13 @@ class EventTransformer(dg.ConfigurableResource):
             column_mapping: Dict mapping old names to new names
 
         Returns:
-            DataFrame with renamed columns
+            DataFrame with renamed columns (`df` itself, modified)
         """
         if df.empty:
             return df
 
-        return df.rename(columns=column_mapping)
+        df.rename(columns=column_mapping, inplace=True)
+        return df
 
     def extract_entity_ids(
         self, df: pd.DataFrame, entity_type: str, id_column: str
@@ -148,24 +199,20 @@ class EventTransformer(dg.ConfigurableResource):
             return []
 
         # Handle both direct IDs and nested objects
-        ids = df[id_column].apply(lambda x: x.get("id") if isinstance(x, dict) else x)
-
-        # Filter out None values and return unique
-        return [id for id in ids.unique() if id is not None]
+        return entity_ids(df[id_column])
 
     def transform_event_data(
         self,
         df: pd.DataFrame,
         config: Dict[str, any],
-        original_data: Optional[List[Dict]] = None,
     ) -> pd.DataFrame:
         """
         Complete transformation pipeline for event data.
 
         Args:
-            df: Raw DataFrame from subgraph
+            df: Raw DataFrame from subgraph (with a raw_data column of JSON
+                text, or one is built from the rows)
             config: Event configuration dict with transformation rules
-            original_data: Original response data for raw_data column
 
         Returns:
             Fully transformed DataFrame ready for DB insertion
@@ -173,6 +220,10 @@ class EventTransformer(dg.ConfigurableResource):
         if df.empty:
             return df
 
+        # The one copy of the pipeline (shallow; the steps below add or
+        # replace columns in place, never write into the caller's data)
+        df = df.copy(deep=False)
+
         # 1. Flatten nested fields
         if config.get("nested_fields"):
             df = self.flatten_nested_fields(df, config["nested_fields"])
@@ -181,10 +232,13 @@ class EventTransformer(dg.ConfigurableResource):
         if config.get("column_mapping"):
             df = self.rename_columns(df, config["column_mapping"])
 
-        # 3. Add raw_data JSONB
-        df = self.prepare_raw_data(df, original_data)
+        # 3. Block position columns as numbers
+        df = self.cast_numeric_columns(df)
+
+        # 4. Add raw_data JSONB
+        df = self.prepare_raw_data(df)
 
-        # 4. Add timestamps
+        # 5. Add timestamps
         df = self.add_timestamps(df)
 
         return df
@@ -1,13 +1,58 @@
-from typing import Optional, List, Dict, Any, Union
+from functools import cached_property
+from typing import Optional, List, Dict, Any, Tuple, Union
+import re
 from dagster import ConfigurableResource
 
+# Selection text per (event, fields, nested fields, ordering), split around
+# `first` and the where clause, the only parts that change between pages
+_SELECTION_PARTS: Dict[Tuple, Tuple[str, str, str]] = {}
+
+# Where-filter keys sent as GraphQL variables by `build_parameterized_query`,
+# with their variable type. Only block positions (BigInt on every event
+# entity); ids and other filters stay inline, their type varies by entity.
+FILTER_VARIABLE_TYPES = {
+    "blockNumber": "BigInt",
+    "blockNumber_gt": "BigInt",
+    "blockNumber_gte": "BigInt",
+    "blockNumber_lt": "BigInt",
+    "logIndex_gt": "BigInt",
+}
+
+
+# What may be spliced into query text unquoted: GraphQL names and directions
+GRAPHQL_NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+ORDER_DIRECTIONS = frozenset({"asc", "desc"})
+
+
+# Closing line of a query document (selections carry their own indentation)
+_DOCUMENT_END = "\n        }"
+
+
+class _Variable:
+    """A where-clause value sent as the GraphQL variable `$name`."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __str__(self) -> str:
+        return f"${self.name}"
+
 
 class SubgraphQueryBuilder(ConfigurableResource):
     """
     Utility for dynamically generating GraphQL queries for subgraph event fetching.
     Supports nested field selections defined per query.
+
+    Config:
+        allowed_events: Event collections queries may select (default: any)
     """
 
+    allowed_events: Optional[List[str]] = None
+
+    @cached_property
+    def _allowed_events(self) -> Optional[frozenset]:
+        return frozenset(self.allowed_events) if self.allowed_events else None
+
     def _build_where_clause(self, **filters: Dict[str, Any]) -> str:
         """Convert Python filters (including nested or arrays) into GraphQL 'where' syntax."""
         if not filters:
@@ -41,15 +86,21 @@ class SubgraphQueryBuilder(ConfigurableResource):
         nested_fields: Optional[Dict[str, List[str]]] = None,
     ) -> str:
         """
-        Recursively build GraphQL selection sets.
+        Build GraphQL selection sets in one pass over an explicit stack.
         Handles nested fields like {"operator": ["id", "address"]}.
         """
-        lines = []
-        for field in fields:
-            if nested_fields and field in nested_fields:
-                subfields = nested_fields[field]
-                sub_block = self._build_fields_block(subfields)
-                lines.append(f"{field} {{\n{sub_block}\n}}")
+        lines: List[str] = []
+        # One iterator per open selection set; only top-level fields nest
+        stack = [iter(fields)]
+        while stack:
+            field = next(stack[-1], None)
+            if field is None:
+                stack.pop()
+                if stack:
+                    lines.append("}")
+            elif len(stack) == 1 and nested_fields and field in nested_fields:
+                lines.append(f"{field} {{")
+                stack.append(iter(nested_fields[field]))
             else:
                 lines.append(field)
         return "\n".join(lines)
@@ -80,7 +131,7 @@ class SubgraphQueryBuilder(ConfigurableResource):
             # fallback: only use block number
             return {"blockNumber_gt": block_number}
 
-    def build_query(
+    def _build_selection(
         self,
         event_name: str,
         fields: List[str],
@@ -92,11 +143,56 @@ class SubgraphQueryBuilder(ConfigurableResource):
         order_direction: str = "asc",
         extra_filters: Optional[Dict[str, Any]] = None,
         nested_fields: Optional[Dict[str, List[str]]] = None,
-        cursor: Optional[Dict[str, Any]] = None,  # 👈 NEW
+        cursor: Optional[Dict[str, Any]] = None,
+        alias: Optional[str] = None,
     ) -> str:
         """
-        Build a complete GraphQL query for subgraph event fetching.
+        Build the top-level selection for one event collection, optionally
+        under a response alias (`alias: eventName(...)`).
         """
+        if extra_filters or (cursor and cursor.get("blockNumber") is not None):
+            filters = self._build_filters(
+                last_id, block_number_gte, block_number_lt, extra_filters, cursor
+            )
+            where_clause = self._build_where_clause(**filters)
+        else:
+            where_clause = self._build_range_where(
+                last_id, block_number_gte, block_number_lt
+            )
+
+        prefix, middle, suffix = self._selection_parts(
+            event_name, fields, nested_fields, order_by, order_direction, alias
+        )
+        return prefix + str(first) + middle + where_clause + suffix
+
+    def _build_range_where(
+        self,
+        last_id: Optional[str] = None,
+        block_number_gte: Optional[int] = None,
+        block_number_lt: Optional[int] = None,
+    ) -> str:
+        """
+        Where clause of the fixed paging filters alone (no cursor, no extra
+        filters), formatted directly; same text as `_build_where_clause`.
+        """
+        parts = []
+        if last_id:
+            parts.append(f'id_gt: "{last_id}"')
+        if block_number_gte is not None:
+            parts.append(f"blockNumber_gte: {block_number_gte}")
+        if block_number_lt is not None:
+            parts.append(f"blockNumber_lt: {block_number_lt}")
+        return f"where: {{{', '.join(parts)}}}" if parts else ""
+
+    def _build_filters(
+        self,
+        last_id: Optional[str] = None,
+        block_number_gte: Optional[int] = None,
+        block_number_lt: Optional[int] = None,
+        extra_filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Collect the where filters of one selection."""
         filters: Dict[str, Any] = {}
 
         if last_id:
@@ -114,23 +210,214 @@ class SubgraphQueryBuilder(ConfigurableResource):
         if extra_filters:
             filters.update(extra_filters)
 
-        where_clause = self._build_where_clause(**filters)
+        return filters
 
-        fields_block = self._build_fields_block(fields, nested_fields)
+    def _lift_variables(
+        self, filters: Dict[str, Any], variables: Dict[str, Tuple[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Replace the values of FILTER_VARIABLE_TYPES keys (also inside nested
+        `or` / `and` filters) by `$variables`, recording name -> (type, value)
+        in `variables`.
+        """
+        lifted: Dict[str, Any] = {}
+        for key, value in filters.items():
+            if isinstance(value, dict):
+                lifted[key] = self._lift_variables(value, variables)
+            elif isinstance(value, list):
+                lifted[key] = [
+                    self._lift_variables(v, variables) if isinstance(v, dict) else v
+                    for v in value
+                ]
+            elif key in FILTER_VARIABLE_TYPES and value is not None:
+                # BigInt variables travel as strings
+                value = str(value)
+                name = key
+                if name in variables and variables[name][1] != value:
+                    name = f"{key}_{len(variables)}"
+                variables[name] = (FILTER_VARIABLE_TYPES[key], value)
+                lifted[key] = _Variable(name)
+            else:
+                lifted[key] = value
+        return lifted
+
+    def _selection_parts(
+        self,
+        event_name: str,
+        fields: List[str],
+        nested_fields: Optional[Dict[str, List[str]]] = None,
+        order_by: str = "id",
+        order_direction: str = "asc",
+        alias: Optional[str] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Selection for one event collection, split around its two variable
+        slots (`first` and the where clause), so a page query is just string
+        concatenation. Built once per event shape and cached for the process.
+        """
+        if self._allowed_events is not None and event_name not in self._allowed_events:
+            raise ValueError(f"Unknown event type: {event_name}")
 
-        query = f"""
-        query {{
-          {event_name}(
-            first: {first},
+        key = (
+            event_name,
+            tuple(fields),
+            tuple(
+                (field, tuple(sub_fields))
+                for field, sub_fields in (nested_fields or {}).items()
+            ),
+            order_by,
+            order_direction,
+            alias,
+        )
+        parts = _SELECTION_PARTS.get(key)
+        if parts is None:
+            # Checked once per shape, before it is cached
+            self._validate_shape(
+                event_name, fields, nested_fields, order_by, order_direction
+            )
+            fields_block = self._build_fields_block(fields, nested_fields)
+            head = f"{alias}: {event_name}" if alias else event_name
+            parts = (
+                f"""
+          {head}(
+            first: """,
+                f""",
             orderBy: {order_by},
             orderDirection: {order_direction}
-            {where_clause}
+            """,
+                f"""
           ) {{
             {fields_block}
-          }}
-        }}
+          }}""",
+            )
+            _SELECTION_PARTS[key] = parts
+        return parts
+
+    def _validate_shape(
+        self,
+        event_name: str,
+        fields: List[str],
+        nested_fields: Optional[Dict[str, List[str]]],
+        order_by: str,
+        order_direction: str,
+    ) -> None:
+        """Reject names that aren't plain GraphQL names (spliced unquoted)."""
+        if order_direction not in ORDER_DIRECTIONS:
+            raise ValueError(f"Invalid order direction: {order_direction}")
+
+        names = [event_name, order_by, *fields]
+        for sub_fields in (nested_fields or {}).values():
+            names.extend(sub_fields)
+        for name in names:
+            if not GRAPHQL_NAME.fullmatch(name):
+                raise ValueError(f"Invalid GraphQL name: {name!r}")
+
+    def _document(self, selections: str, operation: str = "query") -> str:
+        """Wrap selections into a query document, in a single f-string."""
+        return f"{operation} {{{selections}{_DOCUMENT_END}"
+
+    def build_query(
+        self,
+        event_name: str,
+        fields: List[str],
+        *,
+        first: int = 200,
+        last_id: Optional[str] = None,
+        block_number_gte: Optional[int] = None,
+        block_number_lt: Optional[int] = None,
+        order_by: str = "id",
+        order_direction: str = "asc",
+        extra_filters: Optional[Dict[str, Any]] = None,
+        nested_fields: Optional[Dict[str, List[str]]] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build a complete GraphQL query for subgraph event fetching.
+        """
+        selection = self._build_selection(
+            event_name,
+            fields,
+            first=first,
+            last_id=last_id,
+            block_number_gte=block_number_gte,
+            block_number_lt=block_number_lt,
+            order_by=order_by,
+            order_direction=order_direction,
+            extra_filters=extra_filters,
+            nested_fields=nested_fields,
+            cursor=cursor,
+        )
+        return self._document(selection)
+
+    def build_parameterized_query(
+        self,
+        event_name: str,
+        fields: List[str],
+        first: int = 200,
+        last_id: Optional[str] = None,
+        block_number_gte: Optional[int] = None,
+        block_number_lt: Optional[int] = None,
+        order_by: str = "id",
+        order_direction: str = "asc",
+        extra_filters: Optional[Dict[str, Any]] = None,
+        nested_fields: Optional[Dict[str, List[str]]] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Like `build_query`, but `first` and the block position filters are
+        GraphQL variables, so every page of a paging loop sends the same
+        query text (cacheable as parsed / validated by the server).
+
+        Returns:
+            (query, variables) for `SubgraphClient.query(query, variables)`
+        """
+        declared: Dict[str, Tuple[str, Any]] = {"first": ("Int!", first)}
+        filters = self._build_filters(
+            last_id, block_number_gte, block_number_lt, extra_filters, cursor
+        )
+        where_clause = self._build_where_clause(
+            **self._lift_variables(filters, declared)
+        )
+
+        prefix, middle, suffix = self._selection_parts(
+            event_name, fields, nested_fields, order_by, order_direction
+        )
+        selection = prefix + "$first" + middle + where_clause + suffix
+        declarations = ", ".join(
+            f"${name}: {type_}" for name, (type_, _) in declared.items()
+        )
+        variables = {name: value for name, (_, value) in declared.items()}
+        return self._document(selection, f"query Subgraphs({declarations})"), variables
+
+    def build_combined_query(
+        self,
+        configs: List[Dict[str, Any]],
+        filters: Dict[str, Dict[str, Any]],
+        first: int = 200,
+        order_by: str = "blockNumber",
+        order_direction: str = "asc",
+    ) -> str:
         """
-        return query.strip()
+        Build one GraphQL document selecting several event collections.
+
+        Args:
+            configs: EventConfigs to select (one top-level field each)
+            filters: graphql_name -> extra `_build_selection` kwargs
+                (e.g. cursor / block_number_gte) for that event
+        """
+        selections = "".join(
+            self._build_selection(
+                event_name=config["graphql_name"],
+                fields=config["fields"],
+                first=first,
+                order_by=order_by,
+                order_direction=order_direction,
+                nested_fields=config.get("nested_fields"),
+                **filters.get(config["graphql_name"], {}),
+            )
+            for config in configs
+        )
+        return self._document(selections)
 
     def build_block_range_queries(
         self,
@@ -153,3 +440,34 @@ class SubgraphQueryBuilder(ConfigurableResource):
             )
             queries.append(q)
         return queries
+
+    def build_batched_query(
+        self,
+        event_name: str,
+        fields: List[str],
+        block_ranges: List[Dict[str, int]],
+        first: int = 200,
+        nested_fields: Optional[Dict[str, List[str]]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Build one GraphQL document paging several block ranges of an event.
+
+        Range i is selected under the alias `r<i>`, so its rows come back as
+        `data["r<i>"]`. Keep the number of ranges small (up to ~10) to stay
+        under the subgraph's query complexity limits.
+        """
+        selections = "".join(
+            self._build_selection(
+                event_name,
+                fields,
+                first=first,
+                block_number_gte=r.get("gte"),
+                block_number_lt=r.get("lt"),
+                nested_fields=nested_fields,
+                alias=f"r{i}",
+                **kwargs,
+            )
+            for i, r in enumerate(block_ranges)
+        )
+        return self._document(selections)
@@ -1,6 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
 from dagster import ConfigurableResource
+import orjson
+from pydantic import PrivateAttr
 import requests
-from typing import Any, Dict
+from requests.adapters import HTTPAdapter
+import threading
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+from urllib3.util.retry import Retry
+
+# Keep-alive pool for the subgraph host; sized above the fetch concurrency
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Transient gateway / rate-limit responses are retried on the pooled
+# connection with backoff (queries are reads, so POST is safe to repeat)
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    raise_on_status=False,
+)
+
+# Longest GET URL sent; longer queries go as POST (proxies cap around 8 KB)
+MAX_GET_URL_LENGTH = 7 * 1024
+
+# Automatic persisted query errors: the hash is not registered yet, or the
+# server does not do persisted queries at all
+APQ_NOT_FOUND = {"PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound"}
+APQ_NOT_SUPPORTED = {"PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"}
+# Statuses of a hash-only GET from a server that doesn't take them
+APQ_REJECTED_STATUSES = {400, 404, 405}
+
+
+@lru_cache(maxsize=256)
+def _query_hash(query: str) -> str:
+    """sha256 of a query text, as used by automatic persisted queries."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _error_codes(body: Dict[str, Any]) -> set:
+    """Codes (or messages) of the errors of a GraphQL response."""
+    return {
+        (error.get("extensions") or {}).get("code") or error.get("message")
+        for error in body.get("errors") or []
+    }
 
 
 class SubgraphClient(ConfigurableResource):
@@ -8,9 +55,58 @@ class SubgraphClient(ConfigurableResource):
 
     endpoint: str
     api_key: str
+    # Send queries as automatic persisted queries: a GET with only the
+    # query hash, the full text only once per query to register it.
+    # Turns itself off if the server doesn't support them.
+    persisted_queries: bool = False
+
+    _persisted_supported: bool = PrivateAttr(default=True)
+
+    # Sessions shared by every client in the process, one per (host, api
+    # key): Dagster builds a new resource instance per run / step, and they
+    # all reuse the same keep-alive pool
+    _SESSIONS: ClassVar[Dict[Tuple[str, str], requests.Session]] = {}
+    _SESSIONS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session reused by every query to this host, so pages share
+        pooled keep-alive connections instead of a TLS handshake each.
+        Built on first use: loading definitions opens no connections.
+        """
+        key = (urlparse(self.endpoint).netloc, self.api_key)
+        session = self._SESSIONS.get(key)
+        if session is None:
+            with self._SESSIONS_LOCK:
+                session = self._SESSIONS.get(key)
+                if session is None:
+                    session = self._new_session()
+                    self._SESSIONS[key] = session
+        return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RETRY,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}",
+            }
+        )
+        return session
 
     def query(
-        self, query: str, variables: Dict[str, Any] | None = None
+        self,
+        query: str,
+        variables: Dict[str, Any] | None = None,
+        method: Literal["GET", "POST"] = "POST",
     ) -> Dict[str, Any]:
         """
         Execute a GraphQL query against the configured subgraph.
@@ -18,6 +114,10 @@ class SubgraphClient(ConfigurableResource):
         Args:
             query (str): The GraphQL query string.
             variables (dict, optional): Variables for the query.
+            method (str, optional): "GET" sends the query as URL parameters,
+                cacheable by HTTP caches / CDNs; use it only for results that
+                can't change (finalized block ranges). Falls back to POST
+                when the URL would exceed MAX_GET_URL_LENGTH.
 
         Returns:
             dict: Parsed JSON response.
@@ -28,12 +128,31 @@ class SubgraphClient(ConfigurableResource):
             "variables": variables or {},
         }
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        if self.persisted_queries and self._persisted_supported:
+            extensions = {
+                "persistedQuery": {"version": 1, "sha256Hash": _query_hash(query)}
+            }
+            result = self._query_persisted(payload, extensions)
+            if result is not None:
+                return result
+            # Not registered yet: the full query registers it under its hash
+            payload["extensions"] = extensions
 
-        response = requests.post(self.endpoint, json=payload, headers=headers)
+        params = None
+        if method == "GET" and "extensions" not in payload:
+            params = {
+                "query": query,
+                "operationName": payload["operationName"],
+                "variables": orjson.dumps(payload["variables"]).decode(),
+            }
+            if len(self.endpoint) + 1 + len(urlencode(params)) > MAX_GET_URL_LENGTH:
+                params = None
+
+        if params is not None:
+            response = self.session.get(self.endpoint, params=params)
+        else:
+            # Encoded with orjson; the session already sends the JSON content type
+            response = self.session.post(self.endpoint, data=orjson.dumps(payload))
 
         # Raise a clear error if it fails
         if not response.ok:
@@ -41,4 +160,53 @@ class SubgraphClient(ConfigurableResource):
                 f"Subgraph query failed with status {response.status_code}: {response.text}"
             )
 
-        return response.json()
+        # Parsed straight from the (already decompressed) body bytes
+        return orjson.loads(response.content)
+
+    def _query_persisted(
+        self, payload: Dict[str, Any], extensions: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a query by hash only. Returns the parsed response, or None when
+        the full query has to be sent instead.
+        """
+        response = self.session.get(
+            self.endpoint,
+            params={
+                "operationName": payload["operationName"],
+                "variables": orjson.dumps(payload["variables"]).decode(),
+                "extensions": orjson.dumps(extensions).decode(),
+            },
+        )
+        try:
+            body = orjson.loads(response.content)
+            codes = _error_codes(body)
+        except orjson.JSONDecodeError:
+            body, codes = None, set()
+
+        if codes & APQ_NOT_FOUND:
+            return None
+        if codes & APQ_NOT_SUPPORTED or response.status_code in APQ_REJECTED_STATUSES:
+            self._persisted_supported = False
+            return None
+        if not response.ok or body is None:
+            # Transient (429/5xx past the retries): send the full query,
+            # but keep trying hashes on later queries
+            return None
+        return body
+
+    def query_many(
+        self, queries: List[str], max_workers: int = POOL_MAXSIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent queries (e.g. from `build_block_range_queries`)
+        concurrently over the pooled session.
+
+        Returns:
+            list: Parsed JSON responses, in the order of `queries`.
+        """
+        if not queries:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as pool:
+            return list(pool.map(self.query, queries))